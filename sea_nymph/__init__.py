@@ -1,7 +1,22 @@
 from sea_nymph.barplot import barplot
 from sea_nymph.countplot import countplot
+from sea_nymph.ecdfplot import ecdfplot
 from sea_nymph.histplot import histplot
 from sea_nymph.kdeplot import kdeplot
 from sea_nymph.lineplot import lineplot
+from sea_nymph.plan import Plan, plan
+from sea_nymph.report import Report
+from sea_nymph.sketch import QuantileSketch
 
-__all__ = ["barplot", "countplot", "histplot", "kdeplot", "lineplot"]
+__all__ = [
+    "Plan",
+    "QuantileSketch",
+    "Report",
+    "barplot",
+    "countplot",
+    "ecdfplot",
+    "histplot",
+    "kdeplot",
+    "lineplot",
+    "plan",
+]
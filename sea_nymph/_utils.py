@@ -1,3 +1,13 @@
+from __future__ import annotations
+
+import os
+import random
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple
+
+import narwhals as nw
+
+
 def resolve_palette(palette, levels, color) -> list:
     """Resolve a palette, per-level dict, or single colour into a colour list."""
     if palette is None:
@@ -5,3 +15,272 @@ def resolve_palette(palette, levels, color) -> list:
     if isinstance(palette, dict):
         return [palette.get(level) for level in levels]
     return list(palette)
+
+
+def resolve_estimators(estimator, value_col: str) -> dict[str, nw.Expr]:
+    """Normalise an estimator, list or name→estimator dict into aliased expressions."""
+    if estimator is None:
+        return {value_col: nw.col(value_col).mean()}
+    if isinstance(estimator, nw.Expr):
+        return {value_col: estimator.alias(value_col)}
+    if isinstance(estimator, dict):
+        named = {str(name): expr for name, expr in estimator.items()}
+    else:
+        named = {f"__estimator_{i}__": expr for i, expr in enumerate(estimator)}
+    if not named:
+        raise ValueError("estimator must not be empty")
+    return {name: expr.alias(name) for name, expr in named.items()}
+
+
+def series_keys(levels: list, names: list[str]) -> list:
+    """Return one key per emitted series: hue level, estimator name, or both."""
+    if len(names) == 1:
+        return list(levels)
+    if levels == [None]:
+        return list(names)
+    return [(level, name) for level in levels for name in names]
+
+
+def with_row_position(data):
+    """Return `data` as a LazyFrame with its row position in a `__row__` column."""
+    return data.lazy().with_row_index("__row__", order_by=None)
+
+
+def first_row() -> nw.Expr:
+    """Aggregate the first row position of each group into `__first__`."""
+    return nw.col("__row__").min().alias("__first__")
+
+
+def first_seen(result, col: str) -> list:
+    """Order the levels of `col` by the first row they appeared in."""
+    firsts = result.group_by(col).agg(nw.col("__first__").min()).sort("__first__")
+    return firsts[col].to_list()
+
+
+_SORT_ORDERS = ("ascending", "descending")
+
+
+class Ranking(NamedTuple):
+    """Order the first key by an aggregated value instead of by appearance."""
+
+    value: str
+    descending: bool
+    limit: int | None = None
+    level: object = None
+
+
+def resolve_ranking(order, limit: int | None, level, value: str) -> Ranking | None:
+    """Return the `Ranking` for an `order="ascending"/"descending"`, else `None`."""
+    if limit is not None and limit < 1:
+        raise ValueError(f"limit must be at least 1, got {limit}")
+    if isinstance(order, str):
+        if order not in _SORT_ORDERS:
+            raise ValueError(
+                f"order must be a list or one of {_SORT_ORDERS}, got {order!r}"
+            )
+        return Ranking(value, order == "descending", limit, level)
+    if limit is not None:
+        raise ValueError("limit requires order='ascending' or order='descending'")
+    return None
+
+
+def group_levels(
+    data,
+    keys: list[str],
+    given: list,
+    *aggs: nw.Expr,
+    rank: Ranking | None = None,
+    extra: tuple[nw.Expr, ...] = (),
+) -> tuple:
+    """Aggregate `aggs` by `keys` and resolve the level order of each key.
+
+    `given` holds an explicit order, or `None`, per key. Otherwise an `Enum`
+    key (including an ordered pandas `Categorical`) follows its declared
+    categories, restricted to the observed levels, and any other key follows
+    first appearance, tracked in the same aggregation. Row positions are only
+    added when some key needs them, so categorical keys are grouped on their
+    physical codes alone.
+
+    With `rank`, the first key is instead sorted by `rank.value` (summed over
+    the other keys, or taken at the `rank.level` of the second key) and cut to
+    the top `rank.limit` levels, all inside the lazy query, so only those
+    rows are collected. `extra` expressions are evaluated on the aggregated
+    frame before the cut, e.g. totals for normalising.
+    """
+    schema = data.collect_schema()
+    declared = [
+        schema[key].categories if isinstance(schema[key], nw.Enum) else None
+        for key in keys
+    ]
+    needs_order = [g is None and d is None for g, d in zip(given, declared)]
+    if rank is not None:
+        needs_order[0] = False
+    track = any(needs_order)
+    frame = with_row_position(data) if track else data.lazy()
+    grouped = frame.group_by(keys).agg(*([first_row()] if track else []), *aggs)
+    if extra:
+        grouped = grouped.with_columns(*extra)
+    if rank is not None:
+        grouped = _rank_first_key(grouped, keys, rank)
+    result = grouped.collect()
+
+    orders = []
+    for i, (key, g, d) in enumerate(zip(keys, given, declared)):
+        if i == 0 and rank is not None:
+            scores = result.select(key, "__score__").unique()
+            scores = scores.sort(
+                ["__score__", key], descending=[rank.descending, False], nulls_last=True
+            )
+            orders.append(scores[key].to_list())
+        elif g is not None:
+            orders.append(list(g))
+        elif d is not None:
+            observed = set(result[key].to_list())
+            orders.append([c for c in d if c in observed])
+        else:
+            orders.append(first_seen(result, key))
+    return result, orders
+
+
+def _rank_first_key(grouped, keys: list[str], rank: Ranking):
+    cat = keys[0]
+    scores = grouped
+    if rank.level is not None and len(keys) > 1:
+        scores = scores.filter(nw.col(keys[1]) == rank.level)
+    scores = (
+        scores.group_by(cat)
+        .agg(nw.col(rank.value).sum().alias("__score__"))
+        .sort(["__score__", cat], descending=[rank.descending, False], nulls_last=True)
+    )
+    if rank.limit is not None:
+        scores = scores.head(rank.limit)
+    # Semi join: keep the aggregated rows of the top levels only
+    return grouped.join(scores, on=cat, how="inner")
+
+
+def map_levels(func, levels: list, n_jobs: int | None = None) -> list:
+    """Apply `func` to each level, over a bounded thread pool if `n_jobs` allows.
+
+    `n_jobs=None` or `1` runs serially and `-1` uses every core. Results keep
+    the order of `levels`, so the output matches a serial run exactly.
+    """
+    if n_jobs is not None and (n_jobs == 0 or n_jobs < -1):
+        raise ValueError(f"n_jobs must be a positive integer or -1, got {n_jobs}")
+    workers = (os.cpu_count() or 1) if n_jobs == -1 else (n_jobs or 1)
+    if workers == 1 or len(levels) < 2:
+        return [func(level) for level in levels]
+    with ThreadPoolExecutor(max_workers=min(workers, len(levels))) as pool:
+        return list(pool.map(func, levels))
+
+
+_SAMPLE_PRIME = 2_147_483_647  # 2**31 - 1, so squares stay within Int64
+_SAMPLE_MIX = 48_271
+
+
+class Sample(NamedTuple):
+    """Rows to plot, the factor rescaling counts, and the chart's approximation note."""
+
+    data: object
+    scale: float = 1.0
+    note: str | None = None
+
+
+def _sample_key(seed: int) -> nw.Expr:
+    """Hash the row position, mixed with `seed`, into a pseudo-random sort key."""
+    key = (nw.col("__row__").cast(nw.Int64()) + seed * _SAMPLE_MIX + 1) % _SAMPLE_PRIME
+    for _ in range(3):
+        key = (key * key + _SAMPLE_MIX) % _SAMPLE_PRIME
+    return key.alias("__key__")
+
+
+def sample_rows(
+    data, n: int | None, frac: float | None, seed: int | None = None
+) -> Sample:
+    """Return a uniform sample of `data` for an approximate chart.
+
+    Eager frames use the engine's own `sample`. Lazy frames keep the `n`
+    rows with the smallest hashed row position, a bottom-k reservoir the
+    engine evaluates as a streaming top-k, or filter the hash below `frac`,
+    so the collected rows are bounded by the sample size either way. Sampled
+    rows keep their source order.
+    """
+    if n is None and frac is None:
+        return Sample(data)
+    if n is not None and frac is not None:
+        raise ValueError("pass at most one of sample or sample_frac")
+    if n is not None and n < 1:
+        raise ValueError(f"sample must be at least 1, got {n}")
+    if frac is not None and not 0 < frac <= 1:
+        raise ValueError(f"sample_frac must be in (0, 1], got {frac}")
+
+    if isinstance(data, nw.DataFrame):
+        total = len(data)
+        if n is not None and n >= total:
+            return Sample(data)
+        data = (
+            data.with_row_index("__row__")
+            .sample(n=n, fraction=frac, seed=seed)
+            .sort("__row__")
+            .drop("__row__")
+        )
+        kept = len(data)
+        note = f"Approximate: {kept:,} of {total:,} rows sampled"
+        return Sample(data, total / kept if kept else 1.0, note)
+
+    if seed is None:
+        seed = random.randrange(_SAMPLE_PRIME)
+    frame = with_row_position(data).with_columns(_sample_key(seed))
+    if frac is not None:
+        frame = frame.filter(nw.col("__key__") < frac * _SAMPLE_PRIME)
+        scale, note = 1 / frac, f"Approximate: {frac * 100:g}% of rows sampled"
+    else:
+        total = data.lazy().select(nw.len()).collect().item()
+        if n >= total:
+            return Sample(data)
+        frame = frame.top_k(n, by="__key__", reverse=True)
+        scale, note = total / n, f"Approximate: {n:,} of {total:,} rows sampled"
+    # Back in source order, so first-seen level orders still hold
+    frame = frame.sort("__row__").drop("__row__", "__key__")
+    return Sample(frame.collect(), scale, note)
+
+
+_COLUMN_PARAMS = ("x", "y", "hue", "weights")
+
+
+def referenced_columns(kwargs: dict) -> list[str]:
+    """Return the column names a plot call references, without duplicates."""
+    names = [kwargs[p] for p in _COLUMN_PARAMS if kwargs.get(p)]
+    return list(dict.fromkeys(names + list(kwargs.get("columns") or [])))
+
+
+def _scan_entry(plot, scan, fmt: str):
+    def entry(
+        source,
+        *,
+        where: nw.Expr | None = None,
+        columns: list[str] | None = None,
+        backend: str = "polars",
+        **kwargs,
+    ):
+        frame = scan(source, backend=backend)
+        if where is not None:
+            frame = frame.filter(where)
+        # Only the columns the chart references are read (projection pushdown)
+        frame = frame.select(referenced_columns({**kwargs, "columns": columns}))
+        return plot(frame.collect(), **kwargs)
+
+    entry.__name__ = entry.__qualname__ = f"{plot.__name__}.from_{fmt}"
+    entry.__doc__ = (
+        f"Plot `{plot.__name__}` straight from a {fmt.upper()} file via a lazy scan.\n\n"
+        "Only the referenced columns (`x`, `y`, `hue`, `weights`, plus any listed\n"
+        "in `columns`) are read, and the `where` filter is pushed into the scan.\n"
+        f"Remaining keyword arguments are passed to `{plot.__name__}`."
+    )
+    return entry
+
+
+def scan_entry_points(plot):
+    """Attach `from_parquet` and `from_csv` lazy-scan entry points to a plot function."""
+    plot.from_parquet = _scan_entry(plot, nw.scan_parquet, "parquet")
+    plot.from_csv = _scan_entry(plot, nw.scan_csv, "csv")
+    return plot
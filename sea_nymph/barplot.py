@@ -3,10 +3,32 @@ from __future__ import annotations
 import narwhals as nw
 import narwhals.typing as nwt
 
-from sea_nymph._utils import resolve_palette
+from sea_nymph._utils import (
+    group_levels,
+    resolve_estimators,
+    resolve_palette,
+    resolve_ranking,
+    sample_rows,
+    scan_entry_points,
+    series_keys,
+)
 from sea_nymph.mermaidplotlib.xychart import XYChart
 
 
+def _orientation(data, x: str, y: str, orient: str | None) -> tuple[bool, str, str]:
+    """Resolve orientation, returning `(horizontal, cat_col, num_col)`."""
+    if orient in ("h", "y"):
+        horizontal = True
+    elif orient in ("v", "x"):
+        horizontal = False
+    elif orient is None:
+        horizontal = not data.collect_schema()[y].is_numeric()
+    else:
+        raise ValueError("orient must be 'v', 'h', 'x', or 'y'")
+    return (horizontal, y, x) if horizontal else (horizontal, x, y)
+
+
+@scan_entry_points
 @nw.narwhalify
 def barplot(
     data: nwt.IntoFrame,
@@ -14,10 +36,15 @@ def barplot(
     x: str,
     y: str,
     hue: str | None = None,
-    order: list | None = None,
+    order: list | str | None = None,
     hue_order: list | None = None,
-    estimator: nw.Expr | None = None,
+    estimator: nw.Expr | list[nw.Expr] | dict[str, nw.Expr] | None = None,
+    limit: int | None = None,
+    order_by_hue: object = None,
     orient: str | None = None,
+    sample: int | None = None,
+    sample_frac: float | None = None,
+    seed: int | None = None,
     color: str | None = None,
     palette: list | None = None,
 ) -> XYChart:
@@ -31,53 +58,73 @@ def barplot(
         x: Column name for the x-axis.
         y: Column name for the y-axis.
         hue: Column name for grouping into separate series.
-        order: Explicit category order for the categorical axis.
+        order: Explicit category order for the categorical axis, or
+            `"ascending"`/`"descending"` to sort categories by their
+            aggregated value (the first estimator, summed over hue levels)
+            inside the lazy query.
         hue_order: Explicit order for hue levels.
         estimator: Aggregation expression (narwhals Expr). Defaults to mean.
+            A list of expressions, or a dict mapping names to expressions, is
+            evaluated in the same aggregation and emitted as one series each.
+        limit: With a sorted `order`, keep only the first `limit` categories;
+            only their rows are collected.
+        order_by_hue: With a sorted `order`, rank categories by the value of
+            this hue level instead of the sum over levels.
         orient: Force orientation — `"v"`/`"x"` for vertical, `"h"`/`"y"` for
             horizontal. Inferred from column types when `None`.
+        sample: Plot an approximate chart from this many uniformly sampled
+            rows; estimates are taken over the sample as they are.
+            The chart title notes the approximation.
+        sample_frac: Like `sample`, as a fraction of the rows.
+        seed: Seed for `sample`/`sample_frac`, for a reproducible chart.
         color: Single colour for all bars (CSS colour string).
-        palette: List of colours, one per hue level.
+        palette: List of colours, one per series. A dict is keyed by hue level,
+            by estimator name, or by `(level, name)` when both vary.
 
     Returns:
         XYChart: An instance ready to render or further configure.
 
     Raises:
-        ValueError: If a required column is missing or `orient` is invalid.
+        ValueError: If a required column is missing, `orient` is invalid, or
+            `order`/`limit` are invalid.
     """
-    if orient in ("h", "y"):
-        horizontal = True
-    elif orient in ("v", "x"):
-        horizontal = False
-    elif orient is None:
-        horizontal = not data.schema[y].is_numeric()
-    else:
-        raise ValueError("orient must be 'v', 'h', 'x', or 'y'")
-
-    cat_col, num_col = (y, x) if horizontal else (x, y)
+    horizontal, cat_col, num_col = _orientation(data, x, y, orient)
 
     for col in [cat_col, num_col] + ([hue] if hue else []):
         if col not in data.columns:
             raise ValueError(f"Column {col!r} not found in data")
 
-    agg_expr = estimator if estimator is not None else nw.col(num_col).mean()
+    sampled = sample_rows(data, sample, sample_frac, seed)
+    data = sampled.data
+
+    estimators = resolve_estimators(estimator, num_col)
     group_cols = [cat_col, hue] if hue else [cat_col]
-    cats = list(order) if order else data[cat_col].unique(maintain_order=True).to_list()
 
-    # Stay lazy through the aggregation, collect once on the small result
-    result = data.lazy().group_by(group_cols).agg(agg_expr).collect()
-    levels = hue_order or (
-        data[hue].unique(maintain_order=True).to_list() if hue else [None]
+    # Stay lazy through the aggregation, collect once on the small result; the
+    # default order comes out of the same aggregation
+    rank = resolve_ranking(order, limit, order_by_hue, next(iter(estimators)))
+    given = [None if rank else order or None] + ([hue_order or None] if hue else [])
+    result, orders = group_levels(
+        data, group_cols, given, *estimators.values(), rank=rank
+    )
+    cats = orders[0]
+    levels = orders[1] if hue else [None]
+    colors = iter(
+        resolve_palette(palette, series_keys(levels, list(estimators)), color)
     )
-    colors = resolve_palette(palette, levels, color)
 
     chart = XYChart()
-    for level, c in zip(levels, colors):
+    for level in levels:
         sub = result.filter(nw.col(hue) == level) if level is not None else result
-        lookup = dict(zip(sub[cat_col].to_list(), sub[num_col].to_list()))
-        heights = [lookup[cat] for cat in cats]
-        chart.barh(cats, heights, color=c) if horizontal else chart.bar(
-            cats, heights, color=c
-        )
+        for name in estimators:
+            lookup = dict(zip(sub[cat_col].to_list(), sub[name].to_list()))
+            heights = [lookup[cat] for cat in cats]
+            c = next(colors, color)
+            chart.barh(cats, heights, color=c) if horizontal else chart.bar(
+                cats, heights, color=c
+            )
+
+    if sampled.note:
+        chart.title(sampled.note)
 
     return chart
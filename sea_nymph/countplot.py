@@ -3,10 +3,17 @@ from __future__ import annotations
 import narwhals as nw
 import narwhals.typing as nwt
 
+from sea_nymph._utils import (
+    group_levels,
+    resolve_ranking,
+    sample_rows,
+    scan_entry_points,
+)
 from sea_nymph.barplot import barplot
 from sea_nymph.mermaidplotlib.xychart import XYChart
 
 
+@scan_entry_points
 @nw.narwhalify
 def countplot(
     data: nwt.IntoFrame,
@@ -14,9 +21,15 @@ def countplot(
     x: str | None = None,
     y: str | None = None,
     hue: str | None = None,
-    order: list | None = None,
+    order: list | str | None = None,
     hue_order: list | None = None,
+    weights: str | None = None,
     stat: str = "count",
+    limit: int | None = None,
+    order_by_hue: object = None,
+    sample: int | None = None,
+    sample_frac: float | None = None,
+    seed: int | None = None,
     color: str | None = None,
     palette: list | None = None,
 ) -> XYChart:
@@ -27,10 +40,24 @@ def countplot(
         x: Column name for horizontal categories (mutually exclusive with `y`).
         y: Column name for vertical categories (mutually exclusive with `x`).
         hue: Column name for grouping into separate series.
-        order: Explicit category order.
+        order: Explicit category order, or `"ascending"`/`"descending"` to
+            sort categories by count (summed over hue levels) inside the lazy
+            query.
         hue_order: Explicit order for hue levels.
+        weights: Column name of per-row weights, e.g. counts of pre-aggregated
+            rows. Each category sums the weights instead of counting rows.
         stat: Statistic to compute. One of `"count"`, `"percent"`,
             `"proportion"`, `"probability"`.
+        limit: With a sorted `order`, keep only the first `limit` categories;
+            only their rows are collected, while proportions still use the
+            full total.
+        order_by_hue: With a sorted `order`, rank categories by the count of
+            this hue level instead of the sum over levels.
+        sample: Plot an approximate chart from this many uniformly sampled
+            rows; counts are rescaled to the full data.
+            The chart title notes the approximation.
+        sample_frac: Like `sample`, as a fraction of the rows.
+        seed: Seed for `sample`/`sample_frac`, for a reproducible chart.
         color: Single colour for all bars (CSS colour string).
         palette: List of colours, one per hue level.
 
@@ -48,18 +75,33 @@ def countplot(
         )
 
     cat_col = x if x is not None else y
+    sampled = sample_rows(data, sample, sample_frac, seed)
+    data = sampled.data
     group_cols = [cat_col] + ([hue] if hue else [])
 
-    order = order or data[cat_col].unique(maintain_order=True).to_list()
-    hue_order = hue_order or (
-        data[hue].unique(maintain_order=True).to_list() if hue else None
+    count_expr = nw.col(weights).sum() if weights else nw.len()
+    rank = resolve_ranking(order, limit, order_by_hue, "__count__")
+    given = [None if rank else order or None] + ([hue_order or None] if hue else [])
+    # The total is taken before any limit cuts rows
+    total = nw.col("__count__").sum().alias("__total__")
+    counts, orders = group_levels(
+        data,
+        group_cols,
+        given,
+        count_expr.alias("__count__"),
+        rank=rank,
+        extra=(total,) if stat != "count" else (),
     )
-    counts = data.lazy().group_by(group_cols).agg(nw.len().alias("__count__")).collect()
+    order = orders[0]
+    hue_order = orders[1] if hue else None
 
     if stat != "count":
-        n = counts["__count__"].sum()
-        factor = 100 / n if stat == "percent" else 1 / n
-        counts = counts.with_columns((nw.col("__count__") * factor).alias("__count__"))
+        scale = 100 if stat == "percent" else 1
+        counts = counts.with_columns(
+            (nw.col("__count__") * (scale / nw.col("__total__"))).alias("__count__")
+        )
+    elif sampled.scale != 1:
+        counts = counts.with_columns(nw.col("__count__") * sampled.scale)
 
     stat_label = stat.capitalize()
     bp_x, bp_y = (cat_col, "__count__") if x is not None else ("__count__", cat_col)
@@ -73,4 +115,6 @@ def countplot(
         color=color,
         palette=palette,
     )
+    if sampled.note:
+        chart.title(sampled.note)
     return chart.ylabel(stat_label) if x is not None else chart.xlabel(stat_label)
@@ -1,14 +1,70 @@
 from __future__ import annotations
 
+import math
+from itertools import accumulate
+
 import narwhals as nw
 import narwhals.typing as nwt
 
-from sea_nymph._utils import resolve_palette
+from sea_nymph._utils import (
+    first_row,
+    resolve_palette,
+    sample_rows,
+    scan_entry_points,
+    with_row_position,
+)
 from sea_nymph.mermaidplotlib.xychart import XYChart
+from sea_nymph.sketch import QuantileSketch
 
 _VALID_STATS = ("count", "frequency", "probability", "proportion", "percent", "density")
 
 
+_BIN_RULES = ("auto", "fd", "scott", "sturges", "sqrt")
+_MAX_RULE_BINS = 10_000
+
+
+def _column_stats(data, num_col: str, rule: str | None) -> dict:
+    col = nw.col(num_col)
+    exprs = [col.min().alias("min"), col.max().alias("max")]
+    if rule is not None:
+        exprs += [
+            col.count().alias("n"),
+            col.std().alias("std"),
+            col.quantile(0.25, interpolation="linear").alias("q25"),
+            col.quantile(0.75, interpolation="linear").alias("q75"),
+        ]
+    # One lazy pass for every statistic the range and bin rule need
+    return data.lazy().select(exprs).collect().rows(named=True)[0]
+
+
+def _sketch_stats(sketch: QuantileSketch, rule: str | None) -> dict:
+    """Return the statistics `_column_stats` would compute, from a sketch."""
+    stats = {"min": sketch.min, "max": sketch.max}
+    if rule is not None:
+        stats.update(
+            n=sketch.n,
+            std=sketch.std,
+            q25=sketch.quantile(0.25),
+            q75=sketch.quantile(0.75),
+        )
+    return stats
+
+
+def _rule_binwidth(rule: str, stats: dict, lo: float, hi: float) -> float:
+    n = stats["n"]
+    sturges = (hi - lo) / (math.log2(n) + 1)
+    if rule == "sturges":
+        return sturges
+    if rule == "sqrt":
+        return (hi - lo) / math.sqrt(n)
+    if rule == "scott":
+        return (24 * math.sqrt(math.pi) / n) ** (1 / 3) * (stats["std"] or 0.0)
+    fd = 2 * (stats["q75"] - stats["q25"]) * n ** (-1 / 3)
+    if rule == "fd":
+        return fd
+    return min(fd, sturges) if fd > 0 else sturges
+
+
 def _compute_bin_edges(
     data,
     num_col: str,
@@ -16,15 +72,13 @@ def _compute_bin_edges(
     binwidth: float | None,
     binrange: tuple | None,
     discrete: bool,
+    sketch: QuantileSketch | None = None,
 ) -> list[float]:
     if discrete:
         unique_vals = data[num_col].unique().sort().to_list()
         return [v - 0.5 for v in unique_vals] + [unique_vals[-1] + 0.5]
 
-    lo = float(binrange[0]) if binrange else float(data[num_col].min())
-    hi = float(binrange[1]) if binrange else float(data[num_col].max())
-
-    if not isinstance(bins, int):
+    if not isinstance(bins, (int, str)):
         edges = [float(e) for e in bins]
         if len(edges) > 2:
             gaps = [edges[i + 1] - edges[i] for i in range(len(edges) - 1)]
@@ -35,28 +89,206 @@ def _compute_bin_edges(
                 )
         return edges
 
-    n = bins if binwidth is None else max(1, round((hi - lo) / binwidth))
+    rule = bins if isinstance(bins, str) and binwidth is None else None
+    stats = {}
+    if sketch is not None:
+        stats = _sketch_stats(sketch, rule)
+    elif rule or not binrange:
+        stats = _column_stats(data, num_col, rule)
+    lo = float(binrange[0]) if binrange else float(stats["min"])
+    hi = float(binrange[1]) if binrange else float(stats["max"])
+
+    if binwidth is None and rule is not None:
+        binwidth = _rule_binwidth(rule, stats, lo, hi)
+        n = math.ceil((hi - lo) / binwidth) if binwidth > 0 else 1
+        # A heavy tail stretches the range while the rule width stays narrow
+        if n > _MAX_RULE_BINS:
+            raise ValueError(
+                f"bins={rule!r} would give {n:,} bins, more than "
+                f"{_MAX_RULE_BINS:,}; pass binrange to clip the tail or a "
+                "binwidth"
+            )
+    else:
+        n = bins if binwidth is None else max(1, round((hi - lo) / binwidth))
+    # Equal-width edges across [lo, hi], as Mermaid requires
     width = (hi - lo) / n
     return [lo + i * width for i in range(n + 1)]
 
 
+_MULTIPLES = ("stack", "fill")
+
+
+def _level_keys(data, counts, hue: str, hue_order: list | None):
+    """Return the lazy grid of hue levels and the counts keyed the same way.
+
+    Levels are ordered by an integer `__order__`. With `hue_order`, the
+    counts are mapped onto their position in it instead of joining on the
+    hue values, so the key never has to be rebuilt in the column's own dtype
+    (e.g. Arrow `large_string`).
+    """
+    if hue_order is None:
+        keys = counts.group_by(hue).agg(nw.col("__first__").min().alias("__order__"))
+        return keys, counts, hue
+    keys = nw.from_dict(
+        {"__order__": list(range(len(hue_order)))}, backend=data.implementation
+    ).lazy()
+    col = nw.col(hue)
+    if isinstance(data.collect_schema()[hue], (nw.Enum, nw.Categorical)):
+        # Compare by label, so levels outside the categories map to null
+        col = col.cast(nw.String())
+    order = col.replace_strict(
+        list(hue_order),
+        list(range(len(hue_order))),
+        default=None,
+        return_dtype=nw.Int64(),
+    )
+    keys = keys.with_columns(nw.col("__order__").cast(nw.Int64()))
+    return keys, counts.with_columns(order.alias("__order__")), "__order__"
+
+
+def _running_sum(frame, col: str, partition: str, order: str, implementation):
+    """Replace `col` by its running sum along `order` within each `partition`.
+
+    A `cum_sum` window where the backend supports one. PyArrow only runs
+    elementary aggregations over partitions, so there the sum is a self-join
+    on the `(level, bin)` grid instead, quadratic in the partition size.
+    """
+    if implementation is not nw.Implementation.PYARROW:
+        running = nw.col(col).cum_sum().over(partition, order_by=order)
+        return frame.with_columns(running)
+    prior = frame.select(
+        partition, nw.col(order).alias("__prior__"), nw.col(col).alias("__add__")
+    )
+    sums = (
+        frame.select(partition, order)
+        .join(prior, on=partition, how="inner")
+        .filter(nw.col("__prior__") <= nw.col(order))
+        .group_by(partition, order)
+        .agg(nw.col("__add__").sum().alias(col))
+    )
+    return frame.drop(col).join(sums, on=[partition, order], how="left")
+
+
+def _stat_matrix(
+    data, counts, hue, hue_order, n_bins, binw, stat, cumulative, multiple, scale
+):
+    """Turn lazy per-bin counts into the final `(level, bin)` height matrix.
+
+    The grid of every level and bin, the total, cumulative sums, stacking
+    and normalisation are all expressions in one lazy query; the result is
+    sorted by level then bin, `n_bins` rows per level (every `hue_order`
+    level, in that order, when given). `scale` rescales sampled counts to the
+    full data.
+    """
+    bins = nw.from_dict(
+        {"__bin__": list(range(n_bins))}, backend=data.implementation
+    ).lazy()
+    bins = bins.with_columns(nw.col("__bin__").cast(nw.Int32()))
+    keys = ["__bin__"]
+    grid = bins.with_columns(nw.lit(0).alias("__order__"))
+    if hue:
+        levels, counts, key = _level_keys(data, counts, hue, hue_order)
+        keys.append(key)
+        grid = bins.join(levels, how="cross")
+    total = counts.select(nw.col("__count__").sum().alias("__total__"))
+    full = (
+        grid.join(
+            counts.filter(~nw.col("__bin__").is_null()).select(*keys, "__count__"),
+            on=keys,
+            how="left",
+        )
+        .join(total, how="cross")
+        .with_columns(nw.col("__count__").fill_null(0))
+    )
+
+    if cumulative:
+        full = _running_sum(
+            full, "__count__", "__order__", "__bin__", data.implementation
+        )
+    value = nw.col("__count__")
+    # Cumulative frequency and density accumulate bin areas, not heights
+    per_width = 1 if cumulative else binw
+    if stat == "count":
+        value = value.cast(nw.Float64()) * scale
+    elif stat == "frequency":
+        value = value * scale / per_width
+    elif stat in ("probability", "proportion"):
+        value = value / nw.col("__total__")
+    elif stat == "percent":
+        value = value / nw.col("__total__") * 100
+    else:  # density
+        value = value / (nw.col("__total__") * per_width)
+    full = full.with_columns(value.alias("__height__"))
+
+    if multiple is not None:
+        if multiple == "fill":
+            full = full.with_columns(
+                nw.col("__height__").sum().over("__bin__").alias("__bin_total__")
+            )
+        full = _running_sum(
+            full, "__height__", "__bin__", "__order__", data.implementation
+        )
+        if multiple == "fill":
+            bin_total = nw.col("__bin_total__")
+            full = full.with_columns(
+                nw.when(bin_total > 0)
+                .then(nw.col("__height__") / bin_total)
+                .otherwise(0.0)
+                .alias("__height__")
+            )
+
+    return (
+        full.select(*dict.fromkeys([*keys, "__order__"]), "__height__")
+        .sort("__order__", "__bin__")
+        .collect()
+    )
+
+
+def _sketch_heights(
+    sketch: QuantileSketch, edges: list[float], stat: str, cumulative: bool
+) -> list[float]:
+    """Return approximate bar heights from a sketch alone, as `_stat_matrix` would."""
+    counts = sketch.histogram(edges)
+    if cumulative:
+        counts = list(accumulate(counts))
+    per_width = 1 if cumulative else edges[1] - edges[0]
+    total = sketch.n
+    if stat == "count":
+        return counts
+    if stat == "frequency":
+        return [n / per_width for n in counts]
+    if stat in ("probability", "proportion"):
+        return [n / total for n in counts]
+    if stat == "percent":
+        return [n / total * 100 for n in counts]
+    return [n / (total * per_width) for n in counts]  # density
+
+
 def _fmt(v: float) -> str:
     return str(int(v)) if v == int(v) else str(v)
 
 
+@scan_entry_points
 @nw.narwhalify
 def histplot(
-    data: nwt.IntoFrame,
+    data: nwt.IntoFrame | None = None,
     *,
     x: str | None = None,
     y: str | None = None,
     hue: str | None = None,
     hue_order: list | None = None,
+    weights: str | None = None,
     stat: str = "count",
-    bins: int | list = 10,
+    bins: int | str | list = 10,
     binwidth: float | None = None,
     binrange: tuple | None = None,
     discrete: bool = False,
+    sketch: QuantileSketch | None = None,
+    cumulative: bool = False,
+    multiple: str | None = None,
+    sample: int | None = None,
+    sample_frac: float | None = None,
+    seed: int | None = None,
     color: str | None = None,
     palette: list | None = None,
 ) -> XYChart:
@@ -66,17 +298,41 @@ def histplot(
     widths would misrepresent the data and are rejected.
 
     Args:
-        data: Input data. Any narwhals-compatible DataFrame or LazyFrame.
+        data: Input data. Any narwhals-compatible DataFrame or LazyFrame. May
+            be omitted when `sketch` is given, for an approximate histogram.
         x: Column name for horizontal distribution (mutually exclusive with `y`).
         y: Column name for vertical distribution (mutually exclusive with `x`).
         hue: Column name for grouping into separate series.
         hue_order: Explicit order for hue levels.
+        weights: Column name of per-row weights. Each bin sums the weights
+            instead of counting rows, so pre-aggregated data can be plotted
+            without expanding it.
         stat: Statistic to plot. One of `"count"`, `"frequency"`, `"probability"`,
             `"proportion"`, `"percent"`, `"density"`.
-        bins: Number of equal-width bins, or an explicit list of bin edges.
+        bins: Number of equal-width bins, an explicit list of bin edges, or a
+            rule choosing the bin width from the data: `"auto"`, `"fd"`
+            (Freedman–Diaconis), `"scott"`, `"sturges"` or `"sqrt"`. A rule
+            may give at most 10,000 bins.
         binwidth: Width of each bin. Overrides `bins` if provided.
         binrange: `(min, max)` tuple clamping the data range.
         discrete: If `True`, treat each unique integer value as its own bin.
+        sketch: A `QuantileSketch` of the plotted column. Its exact min and
+            max, and approximate quartiles, choose the bin range and rule
+            width in place of a statistics pass over `data`. Without `data`,
+            the bars are approximate counts read from the sketch, and the
+            chart title notes it.
+        cumulative: If `True`, each bar accumulates every bin up to it.
+            `"frequency"` and `"density"` then accumulate bin areas, giving
+            counts and proportions respectively.
+        multiple: How hue levels combine. `"stack"` stacks each level on the
+            ones before it and `"fill"` also normalises every bin to 1. Since
+            Mermaid overlays bars, stacked series are emitted from the top of
+            the stack down.
+        sample: Plot an approximate chart from this many uniformly sampled
+            rows; counts and frequencies are rescaled to the full data.
+            The chart title notes the approximation.
+        sample_frac: Like `sample`, as a fraction of the rows.
+        seed: Seed for `sample`/`sample_frac`, for a reproducible chart.
         color: Single colour for all bars (CSS colour string).
         palette: List of colours, one per hue level.
 
@@ -84,69 +340,116 @@ def histplot(
         XYChart: An instance ready to render or further configure.
 
     Raises:
-        ValueError: If neither or both of `x`/`y` are provided, if `stat` is
-            invalid, or if explicit bin edges are not equally spaced.
+        ValueError: If neither or both of `x`/`y` are provided, if `stat`,
+            `multiple` or the `bins` rule is invalid, if a rule gives more
+            than 10,000 bins, if explicit bin edges are not equally spaced,
+            or if neither `data` nor `sketch` is given or a sketch alone is
+            combined with `hue`, `weights` or `discrete`.
     """
     if (x is None) == (y is None):
         raise ValueError("exactly one of x or y must be provided")
     if stat not in _VALID_STATS:
         raise ValueError(f"stat must be one of {_VALID_STATS}, got {stat!r}")
+    if multiple is not None and multiple not in _MULTIPLES:
+        raise ValueError(f"multiple must be one of {_MULTIPLES}, got {multiple!r}")
+    if isinstance(bins, str) and bins not in _BIN_RULES:
+        raise ValueError(f"bins must be one of {_BIN_RULES}, got {bins!r}")
 
     horizontal = y is not None
     num_col = y if horizontal else x
 
-    for col in [num_col] + ([hue] if hue else []):
+    if data is None:
+        if sketch is None:
+            raise ValueError("data or sketch must be provided")
+        if hue or weights or discrete:
+            raise ValueError("hue, weights and discrete need data, not a sketch")
+        edges = _compute_bin_edges(
+            None, num_col, bins, binwidth, binrange, False, sketch
+        )
+        heights = _sketch_heights(sketch, edges, stat, cumulative)
+        labels = [_fmt(e) for e in edges[:-1]]
+        c = resolve_palette(palette, [None], color)[0]
+        chart = XYChart(f"Approximate: quantile sketch of {sketch.n:,} values")
+        return (
+            chart.barh(labels, heights, color=c)
+            if horizontal
+            else chart.bar(labels, heights, color=c)
+        )
+
+    for col in [num_col] + [c for c in (hue, weights) if c]:
         if col not in data.columns:
             raise ValueError(f"Column {col!r} not found in data")
 
-    edges = _compute_bin_edges(data, num_col, bins, binwidth, binrange, discrete)
+    sampled = sample_rows(data, sample, sample_frac, seed)
+    data = sampled.data
+
+    edges = _compute_bin_edges(
+        data, num_col, bins, binwidth, binrange, discrete, sketch
+    )
     n_bins = len(edges) - 1
     binw = edges[1] - edges[0]
     lo, hi = edges[0], edges[-1]
-    total_n = len(data)
 
     bin_labels = [_fmt(edges[i] + 0.5 if discrete else edges[i]) for i in range(n_bins)]
 
-    counts_df = (
-        data.lazy()
-        .filter(nw.col(num_col).is_between(lo, hi))
+    # Rows outside the range keep a null bin rather than being filtered, so
+    # they still count towards the total and the first-seen hue order
+    counts = (
+        with_row_position(data)
         .with_columns(
-            ((nw.col(num_col) - lo) / binw)
-            .floor()
-            .cast(nw.Int32())
-            .clip(0, n_bins - 1)
+            nw.when(nw.col(num_col).is_between(lo, hi))
+            .then(
+                # Cast after clipping: some engines widen a clipped integer,
+                # and the bin key must match the Int32 grid it is joined onto
+                ((nw.col(num_col) - lo) / binw)
+                .floor()
+                .clip(0, n_bins - 1)
+                .cast(nw.Int32())
+            )
             .alias("__bin__")
         )
         .group_by(["__bin__"] + ([hue] if hue else []))
-        .agg(nw.len().alias("__count__"))
-        .collect()
+        .agg(
+            first_row(),
+            nw.col(weights).sum().alias("__count__")
+            if weights
+            else nw.len().alias("__count__"),
+        )
     )
-
-    levels = hue_order or (
-        data[hue].unique(maintain_order=True).to_list() if hue else [None]
+    matrix = _stat_matrix(
+        data,
+        counts,
+        hue,
+        hue_order,
+        n_bins,
+        binw,
+        stat,
+        cumulative,
+        multiple,
+        sampled.scale,
     )
+    if hue_order is not None:
+        levels = list(hue_order)
+    else:
+        levels = matrix[hue].gather_every(n_bins).to_list() if hue else [None]
+    heights = matrix["__height__"].to_list()
     colors = resolve_palette(palette, levels, color)
 
-    chart = XYChart()
-    for level, c in zip(levels, colors):
-        sub = counts_df.filter(nw.col(hue) == level) if level is not None else counts_df
-        bin_to_count = dict(zip(sub["__bin__"].to_list(), sub["__count__"].to_list()))
-        counts = [bin_to_count.get(i, 0) for i in range(n_bins)]
-
-        if stat == "count":
-            heights = [float(n) for n in counts]
-        elif stat == "frequency":
-            heights = [n / binw for n in counts]
-        elif stat in ("probability", "proportion"):
-            heights = [n / total_n for n in counts]
-        elif stat == "percent":
-            heights = [n / total_n * 100 for n in counts]
-        elif stat == "density":
-            heights = [n / (total_n * binw) for n in counts]
+    # The matrix is sorted by level then bin, n_bins rows per level
+    series = [heights[i : i + n_bins] for i in range(0, len(heights), n_bins)]
+    bars = list(zip(series, colors))
+    if multiple is not None:
+        # Mermaid overlays bars, so the tallest stack is drawn first
+        bars.reverse()
 
+    chart = XYChart()
+    for values, c in bars:
         if horizontal:
-            chart.barh(bin_labels, heights, color=c)
+            chart.barh(bin_labels, values, color=c)
         else:
-            chart.bar(bin_labels, heights, color=c)
+            chart.bar(bin_labels, values, color=c)
+
+    if sampled.note:
+        chart.title(sampled.note)
 
     return chart
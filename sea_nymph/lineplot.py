@@ -1,12 +1,238 @@
 from __future__ import annotations
 
+import re
+from datetime import datetime, timedelta, timezone
+from statistics import NormalDist
+from zoneinfo import ZoneInfo
+
 import narwhals as nw
 import narwhals.typing as nwt
 
-from sea_nymph._utils import resolve_palette
+from sea_nymph._utils import (
+    first_row,
+    first_seen,
+    resolve_estimators,
+    resolve_palette,
+    sample_rows,
+    scan_entry_points,
+    series_keys,
+    with_row_position,
+)
 from sea_nymph.mermaidplotlib.xychart import XYChart
 
+_FIXED_UNITS = {
+    "us": "microseconds",
+    "ms": "milliseconds",
+    "s": "seconds",
+    "m": "minutes",
+    "h": "hours",
+    "d": "days",
+}
+_SUBDAY_UNITS = ("us", "ms", "s", "m", "h")
+_CALENDAR_MONTHS = {"mo": 1, "q": 3, "y": 12}
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _parse_every(every: str) -> tuple[int, str]:
+    match = re.fullmatch(r"(\d+)(us|ms|s|mo|m|h|d|q|y)", every)
+    if match is None or int(match.group(1)) == 0:
+        raise ValueError(
+            f"resample must look like '<n><unit>' with unit one of "
+            f"{sorted([*_FIXED_UNITS, *_CALENDAR_MONTHS])}, got {every!r}"
+        )
+    return int(match.group(1)), match.group(2)
+
+
+def _bucket_label(ordinal: int, unit: str, dtype):
+    """Return the start of the bucket at `ordinal`, in the type of the `x` column.
+
+    `ordinal` counts months for calendar units, wall-clock microseconds for
+    days and UTC microseconds for shorter units, as computed in the engine.
+    """
+    if unit in _CALENDAR_MONTHS:
+        start = datetime(ordinal // 12, ordinal % 12 + 1, 1)
+    else:
+        start = _EPOCH + timedelta(microseconds=ordinal)
+    if dtype == nw.Date:
+        return start.date()
+    if dtype.time_zone is None:
+        return start
+    zone = ZoneInfo(dtype.time_zone)
+    if unit in _SUBDAY_UNITS:
+        return start.replace(tzinfo=timezone.utc).astimezone(zone)
+    return start.replace(tzinfo=zone)
+
+
+_FILLS = ("interpolate", "zero", "nan-drop")
+_MAX_GRID_POINTS = 10_000
+
+
+def _check_grid_size(n: int, hint: str) -> None:
+    if n > _MAX_GRID_POINTS:
+        raise ValueError(
+            f"the x grid would have {n:,} points, more than {_MAX_GRID_POINTS:,}; "
+            f"{hint}"
+        )
+
+
+def _grid_index(data, x: str, resample: str | None, step: float | None):
+    """Return an expression mapping `x` to its grid index, and the grid labels."""
+    col = nw.col(x)
+    if resample is not None:
+        multiple, unit = _parse_every(resample)
+        dtype = data.collect_schema()[x]
+        if dtype == nw.Date and unit in _SUBDAY_UNITS:
+            raise ValueError(
+                f"resample={resample!r} is shorter than a day, but {x!r} is a Date"
+            )
+        bucket = col.dt.truncate(resample)
+        if unit in _SUBDAY_UNITS:
+            # Absolute time, so a DST change skips or repeats a wall-clock hour
+            ordinal = bucket.dt.timestamp("us")
+        elif unit == "d":
+            # Wall-clock days, which last 23 or 25 hours across a DST change
+            if dtype != nw.Date and dtype.time_zone is not None:
+                bucket = bucket.dt.replace_time_zone(None)
+            ordinal = bucket.dt.timestamp("us")
+        else:
+            ordinal = bucket.dt.year() * 12 + bucket.dt.month() - 1
+        if unit in _FIXED_UNITS:
+            width = timedelta(**{_FIXED_UNITS[unit]: multiple}) // timedelta(
+                microseconds=1
+            )
+        else:
+            width = multiple * _CALENDAR_MONTHS[unit]
+        stats = (
+            data.lazy()
+            .select(ordinal.min().alias("lo"), ordinal.max().alias("hi"))
+            .collect()
+            .rows(named=True)[0]
+        )
+        # Labels and the index come from the same engine-side ordinals
+        origin, count = stats["lo"], (stats["hi"] - stats["lo"]) // width + 1
+        _check_grid_size(count, "use a longer resample interval")
+        labels = [_bucket_label(origin + i * width, unit, dtype) for i in range(count)]
+        return (ordinal - origin) // width, labels
+
+    frame = data.lazy().select(x).unique()
+    exprs = [col.min().alias("lo"), col.max().alias("hi")]
+    if step is None:
+        frame = frame.with_columns(col.diff().over(order_by=x).alias("__gap__"))
+        exprs.append(nw.col("__gap__").min().alias("step"))
+    stats = frame.select(exprs).collect().rows(named=True)[0]
+    lo, hi = float(stats["lo"]), float(stats["hi"])
+    step = float(step if step is not None else stats["step"] or 1.0)
+    n = round((hi - lo) / step) + 1
+    _check_grid_size(
+        n, f"step {step:g} is too fine for the x range; pass a larger step"
+    )
+    return ((col - lo) / step).round(0).cast(nw.Int64()), [
+        lo + i * step for i in range(n)
+    ]
+
+
+def _interpolate(frame, names: list[str], hue: str | None):
+    """Linearly interpolate nulls in `names` along the grid index, per hue.
+
+    The scans run over one global order with no partition, which every
+    backend supports: rows are numbered level by level, and a fill reaching
+    into a neighbouring level is discarded by comparing it against the
+    level's first and last row.
+    """
+    order = "__i__"
+    if hue:
+        frame = frame.with_row_index("__pos__", order_by=[hue, "__i__"])
+        order = "__pos__"
+        frame = frame.with_columns(
+            nw.col(order).min().over(hue).alias("__first_pos__"),
+            nw.col(order).max().over(hue).alias("__last_pos__"),
+        )
+
+    def scan(col: str, strategy: str) -> nw.Expr:
+        return nw.col(col).fill_null(strategy=strategy).over(order_by=order)
 
+    # Materialise where each series was observed before scanning over it
+    frame = frame.with_columns(
+        nw.when(~nw.col(name).is_null()).then(nw.col(order)).alias(f"{name}__at")
+        for name in names
+    )
+    filled = []
+    for name in names:
+        prev_i, next_i = scan(f"{name}__at", "forward"), scan(f"{name}__at", "backward")
+        prev_v, next_v = scan(name, "forward"), scan(name, "backward")
+        if hue:
+            same_prev = prev_i >= nw.col("__first_pos__")
+            same_next = next_i <= nw.col("__last_pos__")
+            prev_i, prev_v = (nw.when(same_prev).then(e) for e in (prev_i, prev_v))
+            next_i, next_v = (nw.when(same_next).then(e) for e in (next_i, next_v))
+        between = prev_v + (next_v - prev_v) * (nw.col(order) - prev_i) / (
+            next_i - prev_i
+        )
+        # Outside the observed range the nearest observation is held
+        filled.append(nw.coalesce(nw.col(name), between, prev_v, next_v).alias(name))
+    return frame.with_columns(*filled)
+
+
+_ERRORBARS = {"sd": 1.0, "se": 1.0, "ci": 95.0}
+
+
+def _error_band(y: str, estimate: str, errorbar) -> tuple[list, list]:
+    """Return the aggregations and the `__lower__`/`__upper__` bounds of a band.
+
+    The variance and count are aggregated next to the estimator, and the
+    bounds derived from them on the grouped frame, so the band costs no extra
+    scan. Groups of one row have no variance and collapse onto the estimate.
+    """
+    method, level = (errorbar, None) if isinstance(errorbar, str) else errorbar
+    if method not in _ERRORBARS:
+        raise ValueError(
+            f"errorbar must be one of {tuple(_ERRORBARS)} or a (method, level) "
+            f"tuple, got {errorbar!r}"
+        )
+    level = _ERRORBARS[method] if level is None else level
+    if method == "ci":
+        if not 0 < level < 100:
+            raise ValueError(f"ci level must be between 0 and 100, got {level}")
+        scale = NormalDist().inv_cdf(0.5 + level / 200)
+    else:
+        scale = level
+    spread = nw.col("__var__").fill_null(0).sqrt() * scale
+    if method != "sd":
+        spread = spread / nw.col("__n__").sqrt()
+    stats = [nw.col(y).var().alias("__var__"), nw.col(y).count().alias("__n__")]
+    bounds = [
+        (nw.col(estimate) - spread).alias("__lower__"),
+        (nw.col(estimate) + spread).alias("__upper__"),
+    ]
+    return stats, bounds
+
+
+def _regrid(data, x, hue, aggs, bounds, names, resample, step, fill):
+    """Aggregate onto an evenly spaced grid, reindexing missing points in the engine."""
+    index, labels = _grid_index(data, x, resample, step)
+    keys = ["__i__"] + ([hue] if hue else [])
+    agg = (
+        with_row_position(data)
+        .with_columns(index.alias("__i__"))
+        .group_by(keys)
+        .agg(*aggs)
+    )
+    if bounds:
+        agg = agg.with_columns(*bounds)
+    grid = nw.from_dict(
+        {"__i__": list(range(len(labels)))}, backend=data.implementation
+    ).lazy()
+    if hue:
+        grid = grid.join(agg.select(hue).unique(), how="cross")
+    full = grid.join(agg, on=keys, how="left")
+    if fill == "zero":
+        full = full.with_columns(nw.col(*names).fill_null(0))
+    elif fill == "interpolate":
+        full = _interpolate(full, names, hue)
+    return full.collect(), labels
+
+
+@scan_entry_points
 @nw.narwhalify
 def lineplot(
     data: nwt.IntoFrame,
@@ -15,7 +241,14 @@ def lineplot(
     y: str,
     hue: str | None = None,
     hue_order: list | None = None,
-    estimator: nw.Expr | None = None,
+    estimator: nw.Expr | list[nw.Expr] | dict[str, nw.Expr] | None = None,
+    resample: str | None = None,
+    fill: str | None = None,
+    step: float | None = None,
+    errorbar: str | tuple[str, float] | None = None,
+    sample: int | None = None,
+    sample_frac: float | None = None,
+    seed: int | None = None,
     color: str | None = None,
     palette: list | None = None,
 ) -> XYChart:
@@ -31,40 +264,129 @@ def lineplot(
         hue: Column name for grouping into separate series.
         hue_order: Explicit order for hue levels.
         estimator: Aggregation expression (narwhals Expr). Defaults to mean.
+            A list of expressions, or a dict mapping names to expressions, is
+            evaluated in the same aggregation and emitted as one series each.
+        resample: Bucket length for a date/datetime `x`, e.g. `"1h"`, `"15m"`,
+            `"1d"` or `"1mo"`. `x` is truncated to buckets inside the lazy query
+            and aggregated with `estimator`; empty buckets are handled by
+            `fill` (default `"zero"`) so the axis is evenly spaced. Across a
+            DST change, sub-day buckets follow absolute time and day or longer
+            buckets follow the wall clock. A `Date` x needs at least `"1d"`.
+        fill: Reindex a numeric `x` onto an evenly spaced grid instead of
+            failing on gaps. `"interpolate"` fills missing points linearly,
+            `"zero"` fills them with 0, and `"nan-drop"` drops them, which is
+            only valid at the ends of the grid. Runs in the engine before
+            collecting.
+        step: Grid spacing used with `fill`. Inferred as the smallest gap
+            between distinct x values when `None`; values are snapped to the
+            nearest grid point. The grid may hold at most 10,000 points.
+        errorbar: Draw lower and upper lines around the estimate, in the same
+            colour. `"sd"` spans one standard deviation, `"se"` one standard
+            error and `"ci"` a normal 95% confidence interval; a tuple such as
+            `("sd", 2)` or `("ci", 99)` sets the multiple or level. The
+            variance and count are aggregated in the same pass as `estimator`.
+        sample: Plot an approximate chart from this many uniformly sampled
+            rows; estimates are taken over the sample as they are.
+            The chart title notes the approximation.
+        sample_frac: Like `sample`, as a fraction of the rows.
+        seed: Seed for `sample`/`sample_frac`, for a reproducible chart.
         color: Single colour for the line (CSS colour string).
-        palette: List of colours, one per hue level.
+        palette: List of colours, one per series. A dict is keyed by hue level,
+            by estimator name, or by `(level, name)` when both vary.
 
     Returns:
         XYChart: An instance ready to render or further configure.
 
     Raises:
-        ValueError: If a required column is missing or numeric x values are not
-            evenly spaced.
+        ValueError: If a required column is missing, numeric x values are not
+            evenly spaced, `resample` is invalid, used on a non-temporal x or
+            shorter than a day on a `Date` x, `fill` is invalid or used on a
+            categorical x, `step` is not positive, the grid would exceed
+            10,000 points, or `errorbar` is invalid or combined with several
+            estimators.
     """
     for col in [x, y] + ([hue] if hue else []):
         if col not in data.columns:
             raise ValueError(f"Column {col!r} not found in data")
 
-    agg_expr = estimator if estimator is not None else nw.col(y).mean()
+    sampled = sample_rows(data, sample, sample_frac, seed)
+    data = sampled.data
+
+    estimators = resolve_estimators(estimator, y)
+    stats, bounds = [], []
+    if errorbar is not None:
+        if len(estimators) != 1:
+            raise ValueError("errorbar requires a single estimator")
+        stats, bounds = _error_band(y, next(iter(estimators)), errorbar)
+    agg_exprs = [first_row(), *estimators.values(), *stats]
+    names = list(estimators) + (["__lower__", "__upper__"] if bounds else [])
     group_cols = [x, hue] if hue else [x]
-    numeric_x = data.schema[x].is_numeric()
+    numeric_x = data.collect_schema()[x].is_numeric()
+
+    if fill is not None and fill not in _FILLS:
+        raise ValueError(f"fill must be one of {_FILLS}, got {fill!r}")
+    if step is not None and not step > 0:
+        raise ValueError(f"step must be positive, got {step}")
+    if resample is not None:
+        if not data.collect_schema()[x].is_temporal():
+            raise ValueError(f"resample requires a date/datetime x, got {x!r}")
+        _parse_every(resample)
+        fill = fill or "zero"
+    elif fill is not None and not numeric_x:
+        raise ValueError(f"fill requires a numeric x or resample, got {x!r}")
 
-    if numeric_x:
-        result = data.lazy().group_by(group_cols).agg(agg_expr).sort(x).collect()
-        xs = result[x].unique(maintain_order=True).to_list()
+    if fill is not None:
+        result, xs = _regrid(
+            data, x, hue, agg_exprs, bounds, names, resample, step, fill
+        )
+        key, positions = "__i__", range(len(xs))
     else:
-        result = data.lazy().group_by(group_cols).agg(agg_expr).collect()
-        xs = data[x].unique(maintain_order=True).to_list()
+        grouped = with_row_position(data).group_by(group_cols).agg(*agg_exprs)
+        if bounds:
+            grouped = grouped.with_columns(*bounds)
+        result = grouped.collect()
+        if numeric_x:
+            xs = result[x].unique().sort().to_list()
+        else:
+            xs = first_seen(result, x)
+        key, positions = x, xs
 
-    levels = hue_order or (
-        data[hue].unique(maintain_order=True).to_list() if hue else [None]
+    levels = hue_order or (first_seen(result, hue) if hue else [None])
+    colors = iter(
+        resolve_palette(palette, series_keys(levels, list(estimators)), color)
     )
-    colors = resolve_palette(palette, levels, color)
 
-    chart = XYChart()
-    for level, c in zip(levels, colors):
+    series = []
+    for level in levels:
         sub = result.filter(nw.col(hue) == level) if level is not None else result
-        lookup = dict(zip(sub[x].to_list(), sub[y].to_list()))
-        chart.line(xs, [lookup[xi] for xi in xs], color=c)
+        for name in names:
+            lookup = dict(zip(sub[key].to_list(), sub[name].to_list()))
+            series.append([lookup.get(p) for p in positions])
+
+    if fill == "nan-drop":
+        # Backends without a float null (pandas) leave NaN where a point is missing
+        kept = [
+            i
+            for i in range(len(xs))
+            if all(s[i] is not None and s[i] == s[i] for s in series)
+        ]
+        if kept and kept[-1] - kept[0] + 1 != len(kept):
+            raise ValueError(
+                "Numeric axis values are not evenly spaced after dropping missing "
+                "grid points; use fill='interpolate' or fill='zero' instead."
+            )
+        xs = [xs[i] for i in kept]
+        series = [[s[i] for i in kept] for s in series]
+
+    chart = XYChart()
+    # A band's lower and upper lines share the colour of their estimate
+    per_colour = len(names) - len(estimators) + 1
+    for i, values in enumerate(series):
+        if i % per_colour == 0:
+            c = next(colors, color)
+        chart.line(xs, values, color=c)
+
+    if sampled.note:
+        chart.title(sampled.note)
 
     return chart
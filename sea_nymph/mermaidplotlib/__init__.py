@@ -1,3 +1,4 @@
+from sea_nymph.mermaidplotlib.livechart import LiveChart
 from sea_nymph.mermaidplotlib.xychart import XYChart
 
-__all__ = ["XYChart"]
+__all__ = ["LiveChart", "XYChart"]
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import math
+from collections import deque
+from collections.abc import Callable
+
+from sea_nymph.mermaidplotlib.xychart import (
+    XYChart,
+    _format_category,
+    _format_number,
+    _number_formatter,
+)
+
+
+class LiveChart(XYChart):
+    """A rolling XYChart backed by fixed-capacity ring buffers.
+
+    Declare the series once with `add_line`/`add_bar`, then `append` one point
+    per update. Only the newest `capacity` points are kept, and each value is
+    formatted once when appended, so an update costs O(1) before rendering.
+    For the same reason `precision`/`sig_digits` are fixed before the first
+    append rather than chosen at render time.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        title: str | None = None,
+        *,
+        precision: int | None = None,
+        sig_digits: int | None = None,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError(f"capacity must be at least 1, got {capacity}")
+        self._capacity = capacity
+        self._xs: deque[float | str] = deque(maxlen=capacity)
+        self._x_fragments: deque[str] = deque(maxlen=capacity)
+        self._x_numeric: bool | None = None
+        self._x_step: float | None = None
+        self._buffers: list[tuple[str, deque[str], str | None]] = []
+        super().__init__(title, precision=precision, sig_digits=sig_digits)
+
+    def add_line(self, color: str | None = None) -> LiveChart:
+        """Declare a line series, filled by subsequent `append` calls."""
+        return self._add_buffer("line", color)
+
+    def add_bar(self, color: str | None = None) -> LiveChart:
+        """Declare a bar series, filled by subsequent `append` calls."""
+        return self._add_buffer("bar", color)
+
+    def _add_buffer(self, series_type: str, color: str | None) -> LiveChart:
+        if self._xs:
+            raise ValueError("series must be declared before the first append")
+        self._buffers.append((series_type, deque(maxlen=self._capacity), color))
+        return self
+
+    def bar(self, x, height, color: str | None = None) -> XYChart:
+        """Not supported; declare series with `add_bar` and use `append`."""
+        raise TypeError("LiveChart series are declared with add_bar/add_line")
+
+    barh = line = lineh = bar
+
+    def xlim(self, min: float, max: float) -> XYChart:
+        """Not supported; the x range follows the buffered window."""
+        raise TypeError("LiveChart derives the x range from the buffered window")
+
+    def precision(
+        self, precision: int | None = None, sig_digits: int | None = None
+    ) -> LiveChart:
+        """Set how values are rounded; only allowed before the first append."""
+        if self._xs:
+            raise ValueError("precision must be set before the first append")
+        self._fmt = _number_formatter(precision, sig_digits)
+        super().precision(precision, sig_digits)
+        return self
+
+    def append(self, x: float | str, *ys: float) -> LiveChart:
+        """Append one point to every series, evicting the oldest when full.
+
+        Args:
+            x: The x value. Numeric x values must continue the established step
+                so the axis stays evenly spaced; anything else is a category.
+            *ys: One value per declared series, in declaration order.
+
+        Returns:
+            LiveChart: The chart itself, for chaining.
+
+        Raises:
+            ValueError: If the number of values does not match the declared
+                series, x or a value is not finite, or numeric x breaks the
+                spacing.
+            TypeError: If a value is not numeric or x mixes numbers and
+                categories.
+        """
+        if len(ys) != len(self._buffers):
+            raise ValueError(
+                f"expected {len(self._buffers)} values, one per series, got {len(ys)}"
+            )
+        fragments = []
+        for i, v in enumerate(ys):
+            try:
+                f = float(v)
+            except (TypeError, ValueError):
+                raise TypeError(f"ys[{i}] is not numeric: {v!r}")
+            if not math.isfinite(f):
+                raise ValueError(f"ys[{i}] is not finite: {v!r}")
+            fragments.append(self._fmt(f))
+
+        self._push_x(x)
+        for (_, buffer, _), fragment in zip(self._buffers, fragments):
+            buffer.append(fragment)
+        return self
+
+    def _push_x(self, x) -> None:
+        try:
+            value = float(x)
+        except (TypeError, ValueError):
+            value = None
+        numeric = value is not None
+        if numeric and not math.isfinite(value):
+            # NaN would pass every later spacing check; infinity breaks rendering
+            raise ValueError(f"x is not finite: {x!r}")
+        if self._x_numeric is not None and numeric != self._x_numeric:
+            raise TypeError(f"x {x!r} mixes numeric and categorical values")
+        self._x_numeric = numeric
+        if not numeric:
+            self._xs.append(str(x))
+            self._x_fragments.append(_format_category(x))
+            return
+        if self._xs:
+            gap = value - self._xs[-1]
+            if self._x_step is None and len(self._xs) == 1:
+                if gap <= 0:
+                    raise ValueError(f"x must increase, got {x!r} after {self._xs[-1]}")
+                self._x_step = gap
+            elif abs(gap - self._x_step) > 1e-9 * abs(self._x_step):
+                raise ValueError(
+                    f"x {x!r} does not continue the step {self._x_step}; "
+                    "Mermaid xychart places points equidistantly."
+                )
+        self._xs.append(value)
+
+    def __len__(self) -> int:
+        return len(self._xs)
+
+    def _validate_series_consistency(self) -> None:
+        if not self._xs:
+            raise ValueError("LiveChart has no data; call append first")
+
+    def _series_colors(self) -> list[str | None]:
+        return [color for _, _, color in self._buffers]
+
+    def render(
+        self, precision: int | None = None, sig_digits: int | None = None
+    ) -> str:
+        """Render the chart as a Mermaid diagram string.
+
+        Args:
+            precision: Not supported; values are formatted on append.
+            sig_digits: Not supported; values are formatted on append.
+
+        Returns:
+            str: The Mermaid diagram source.
+
+        Raises:
+            TypeError: If `precision` or `sig_digits` is given.
+        """
+        if precision is not None or sig_digits is not None:
+            raise TypeError("LiveChart formats values on append; set precision first")
+        return super().render()
+
+    def _render_series(self, fmt: Callable[[float], str]) -> list[str]:
+        return [
+            f"    {series_type} [{', '.join(buffer)}]"
+            for series_type, buffer, _ in self._buffers
+        ]
+
+    def _render_x_axis(self) -> str | None:
+        parts = []
+        if self._x_label is not None:
+            parts.append(f'"{self._x_label}"')
+        if self._x_numeric:
+            parts.append(
+                f"{_format_number(self._xs[0])} --> {_format_number(self._xs[-1])}"
+            )
+        else:
+            parts.append(f"[{', '.join(self._x_fragments)}]")
+        return f"    x-axis {' '.join(parts)}"
@@ -2,8 +2,11 @@ from __future__ import annotations
 
 import math
 import re
+from collections.abc import Callable
 from pathlib import Path
 
+import narwhals as nw
+
 
 def _format_category(label: str) -> str:
     """Return a Mermaid-safe category label, quoting if necessary."""
@@ -24,10 +27,130 @@ def _format_number(n: float) -> str:
     return f"{n:.15f}".rstrip("0").rstrip(".")
 
 
+def _format_fixed(n: float, decimals: int) -> str:
+    """Format a float with at most `decimals` places, stripping trailing zeros."""
+    s = f"{n:.{decimals}f}"
+    if "." in s:
+        s = s.rstrip("0").rstrip(".")
+    return "0" if s == "-0" else s
+
+
+def _format_significant(n: float, sig_digits: int) -> str:
+    """Format a float to `sig_digits` significant digits, in fixed notation."""
+    if n == 0:
+        return "0"
+    decimals = sig_digits - 1 - math.floor(math.log10(abs(n)))
+    if decimals < 0:
+        return _format_fixed(round(n, decimals), 0)
+    return _format_fixed(n, decimals)
+
+
+def _number_formatter(
+    precision: int | None, sig_digits: int | None
+) -> Callable[[float], str]:
+    """Return the series value formatter for a precision setting."""
+    if precision is not None and sig_digits is not None:
+        raise ValueError("pass at most one of precision or sig_digits")
+    if precision is not None:
+        if precision < 0:
+            raise ValueError(f"precision must be non-negative, got {precision}")
+        return lambda n: _format_fixed(n, precision)
+    if sig_digits is not None:
+        if sig_digits < 1:
+            raise ValueError(f"sig_digits must be at least 1, got {sig_digits}")
+        return lambda n: _format_significant(n, sig_digits)
+    return _format_number
+
+
+def _numpy():
+    """Return the numpy module if installed; it is an optional dependency."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _as_vector(data):
+    """Return `data` as a narwhals Series or 1-D NumPy array, without copying.
+
+    Series from any narwhals-compatible backend (Polars, pandas, Arrow chunked
+    arrays, ...) are wrapped as narwhals Series; NumPy arrays, Arrow arrays and
+    other buffer-protocol objects are viewed through NumPy when it is
+    installed. Anything else, including plain lists, returns `None` and takes
+    the element-wise path.
+    """
+    if isinstance(data, (list, tuple, range, str, bytes)):
+        return None
+    if isinstance(data, nw.Series):
+        return data
+    series = nw.from_native(data, series_only=True, pass_through=True)
+    if isinstance(series, nw.Series):
+        return series
+    np = _numpy()
+    if np is None:
+        return None
+    if not hasattr(data, "__array__"):
+        try:
+            memoryview(data)
+        except TypeError:
+            return None
+    array = np.asarray(data)
+    return array if array.ndim == 1 else None
+
+
+def _vector_is_numeric(vector) -> bool:
+    if isinstance(vector, nw.Series):
+        return vector.dtype.is_numeric()
+    return vector.dtype.kind in "biuf"
+
+
+def _vector_is_finite(vector) -> bool:
+    if isinstance(vector, nw.Series):
+        if vector.null_count():
+            return False
+        # Only floats can hold NaN or infinity; integers and decimals cannot
+        return not vector.dtype.is_float() or bool(vector.is_finite().all())
+    return vector.dtype.kind != "f" or bool(_numpy().isfinite(vector).all())
+
+
+def _vector_gaps(vector) -> tuple[float, float]:
+    """Return the smallest and largest step between consecutive values."""
+    if isinstance(vector, nw.Series):
+        gaps = vector.diff().drop_nulls()
+    elif vector.dtype.kind == "u":
+        # Unsigned differences wrap around, so step through floats
+        gaps = _numpy().diff(vector.astype("float64"))
+    else:
+        gaps = _numpy().diff(vector)
+    return float(gaps.min()), float(gaps.max())
+
+
+def _readonly(vector):
+    """Return a NumPy array as a read-only view; Series are returned as they are."""
+    if isinstance(vector, nw.Series):
+        return vector
+    view = vector.view()
+    view.flags.writeable = False
+    return view
+
+
+def _vector_to_list(vector) -> list:
+    if isinstance(vector, nw.Series):
+        return vector.to_list()
+    return vector.tolist()
+
+
 class XYChart:
     """A Mermaid xyChart diagram builder with a matplotlib-style fluent API."""
 
-    def __init__(self, title: str | None = None) -> None:
+    def __init__(
+        self,
+        title: str | None = None,
+        *,
+        precision: int | None = None,
+        sig_digits: int | None = None,
+    ) -> None:
         self._title = title
         self._x_categories: list[str] | None = None
         self._x_count: int | None = None  # length for numeric x, since no category list
@@ -39,14 +162,30 @@ class XYChart:
         self._y_label: str | None = None
         self._y_min: float | None = None  # Mermaid y-axis range (user-set only)
         self._y_max: float | None = None
+        # Series data is a list of floats, or a validated vector kept uncopied
+        # (a read-only view for NumPy arrays)
         self._series: list[tuple[str, list[float], str | None]] = []
         self._horizontal: bool | None = None
+        self.precision(precision, sig_digits)
 
     def title(self, title: str) -> XYChart:
         """Set the chart title."""
         self._title = title
         return self
 
+    def precision(
+        self, precision: int | None = None, sig_digits: int | None = None
+    ) -> XYChart:
+        """Set how series values are rounded when rendered.
+
+        `precision` keeps at most that many decimal places and `sig_digits`
+        that many significant digits; pass neither for full precision. Values
+        are quantized as they are formatted, so the stored data is unchanged.
+        """
+        _number_formatter(precision, sig_digits)
+        self._precision, self._sig_digits = precision, sig_digits
+        return self
+
     def xlabel(self, label: str) -> XYChart:
         """Set the x-axis label (respects horizontal orientation)."""
         if self._horizontal:
@@ -80,17 +219,31 @@ class XYChart:
         return self
 
     def bar(self, x, height, color: str | None = None) -> XYChart:
-        """Add a vertical bar series."""
+        """Add a vertical bar series.
+
+        Series and NumPy arrays are validated here and kept without copying,
+        so mutating them before `render` changes the chart; values are
+        checked for finiteness again when rendered.
+        """
         self._set_x_axis(x)
         return self._add_series("bar", height, horizontal=False, color=color)
 
     def barh(self, y, width, color: str | None = None) -> XYChart:
-        """Add a horizontal bar series."""
+        """Add a horizontal bar series. Vector inputs are kept as in `bar`."""
         self._set_x_axis(y)
         return self._add_series("bar", width, horizontal=True, color=color)
 
     @staticmethod
-    def _check_evenly_spaced(axis: list) -> None:
+    def _check_evenly_spaced(axis) -> None:
+        vector = _as_vector(axis)
+        if vector is not None:
+            if not _vector_is_numeric(vector) or len(vector) < 2:
+                return
+            lo, hi = _vector_gaps(vector)
+            span = abs(float(vector[len(vector) - 1]) - float(vector[0]))
+            if hi - lo <= 1e-9 * span:
+                return
+            axis = _vector_to_list(vector)  # Build the detailed error message
         try:
             floats = [float(v) for v in axis]
         except (TypeError, ValueError):
@@ -104,8 +257,11 @@ class XYChart:
                 )
 
     def line(self, x, y, color: str | None = None) -> XYChart:
-        """Add a line series. Numeric x values must be evenly spaced."""
-        if not isinstance(x, list):
+        """Add a line series. Numeric x values must be evenly spaced.
+
+        Series and NumPy arrays are kept without copying, as in `bar`.
+        """
+        if not isinstance(x, list) and _as_vector(x) is None:
             x = list(x)
         self._check_evenly_spaced(x)
         if self._horizontal:
@@ -115,22 +271,32 @@ class XYChart:
         return self._add_series("line", y, horizontal=None, color=color)
 
     def lineh(self, y, x, color: str | None = None) -> XYChart:
-        """Add a horizontal line series. Numeric y values must be evenly spaced."""
-        if not isinstance(y, list):
+        """Add a horizontal line series. Numeric y values must be evenly spaced.
+
+        Series and NumPy arrays are kept without copying, as in `bar`.
+        """
+        if not isinstance(y, list) and _as_vector(y) is None:
             y = list(y)
         self._check_evenly_spaced(y)
         self._set_x_axis(y)
         return self._add_series("line", x, horizontal=True, color=color)
 
     def _set_x_axis(self, x) -> None:
-        x_list = list(x)
-        try:
-            x_floats = [float(v) for v in x_list]
-        except (TypeError, ValueError):
-            x_floats = None
+        vector = _as_vector(x)
+        if vector is not None and _vector_is_numeric(vector) and len(vector):
+            # min/max run vectorized; the values themselves are never copied
+            x_floats = vector
+            x_min, x_max = float(vector.min()), float(vector.max())
+        else:
+            x_list = _vector_to_list(vector) if vector is not None else list(x)
+            try:
+                x_floats = [float(v) for v in x_list]
+            except (TypeError, ValueError):
+                x_floats = None
+            else:
+                x_min, x_max = min(x_floats), max(x_floats)
 
         if x_floats is not None:
-            x_min, x_max = min(x_floats), max(x_floats)
             if self._x_min is not None and (
                 self._x_min != x_min or self._x_max != x_max
             ):
@@ -161,16 +327,17 @@ class XYChart:
                     f"with {new} (horizontal={horizontal})"
                 )
             self._horizontal = horizontal
-        coerced: list[float] = []
-        for i, v in enumerate(data):
-            try:
-                f = float(v)
-            except (TypeError, ValueError):
-                raise TypeError(f"data[{i}] is not numeric: {v!r}")
-            if not math.isfinite(f):
-                raise ValueError(f"data[{i}] is not finite: {v!r}")
-            coerced.append(f)
-        if not coerced:
+        vector = _as_vector(data)
+        if (
+            vector is not None
+            and _vector_is_numeric(vector)
+            and _vector_is_finite(vector)
+        ):
+            # Read-only, so nothing writes through the chart into the caller's data
+            coerced = _readonly(vector)
+        else:
+            coerced = self._coerce(data if vector is None else _vector_to_list(vector))
+        if not len(coerced):
             raise ValueError("data must not be empty")
         x_len = (
             len(self._x_categories) if self._x_categories is not None else self._x_count
@@ -187,6 +354,19 @@ class XYChart:
         self._series.append((series_type, coerced, color))
         return self
 
+    @staticmethod
+    def _coerce(data) -> list[float]:
+        coerced: list[float] = []
+        for i, v in enumerate(data):
+            try:
+                f = float(v)
+            except (TypeError, ValueError):
+                raise TypeError(f"data[{i}] is not numeric: {v!r}")
+            if not math.isfinite(f):
+                raise ValueError(f"data[{i}] is not finite: {v!r}")
+            coerced.append(f)
+        return coerced
+
     def _render_x_axis(self) -> str | None:
         if self._x_categories is not None:
             parts = []
@@ -235,12 +415,43 @@ class XYChart:
                 f"x-axis has {x_len} points but series have {expected} values"
             )
 
-    def render(self) -> str:
-        """Render the chart as a Mermaid diagram string."""
+    def _series_colors(self) -> list[str | None]:
+        return [color for _, _, color in self._series]
+
+    def _render_series(self, fmt: Callable[[float], str]) -> list[str]:
+        lines = []
+        for series_type, data, _ in self._series:
+            if not isinstance(data, list):
+                # The caller may have written a NaN into the buffer since it was added
+                finite = _vector_is_finite(data)
+                data = _vector_to_list(data)
+                if not finite:
+                    data = self._coerce(data)
+            values = ", ".join(map(fmt, data))
+            lines.append(f"    {series_type} [{values}]")
+        return lines
+
+    def render(
+        self, precision: int | None = None, sig_digits: int | None = None
+    ) -> str:
+        """Render the chart as a Mermaid diagram string.
+
+        Args:
+            precision: Round series values to at most this many decimal places.
+            sig_digits: Round series values to this many significant digits.
+                Pass at most one of the two; if neither is given, the chart's
+                `precision()` setting applies.
+
+        Returns:
+            str: The Mermaid diagram source.
+        """
+        if precision is None and sig_digits is None:
+            precision, sig_digits = self._precision, self._sig_digits
+        fmt = _number_formatter(precision, sig_digits)
         self._validate_series_consistency()
         lines: list[str] = []
 
-        colors = [color for _, _, color in self._series]
+        colors = self._series_colors()
         if any(c is not None for c in colors):
             palette = ",".join(c or "#888888" for c in colors)
             lines.append(
@@ -264,9 +475,7 @@ class XYChart:
         if y_line:
             lines.append(y_line)
 
-        for series_type, data, _ in self._series:
-            values = ", ".join(_format_number(v) for v in data)
-            lines.append(f"    {series_type} [{values}]")
+        lines.extend(self._render_series(fmt))
 
         return "\n".join(lines)
 
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import narwhals as nw
+import narwhals.typing as nwt
+
+from sea_nymph._utils import group_levels, referenced_columns
+from sea_nymph.barplot import _orientation, barplot
+from sea_nymph.countplot import countplot
+from sea_nymph.ecdfplot import ecdfplot
+from sea_nymph.histplot import histplot
+from sea_nymph.kdeplot import kdeplot
+from sea_nymph.lineplot import lineplot
+from sea_nymph.mermaidplotlib.xychart import XYChart
+
+
+class Plan:
+    """A batch of chart requests computed from one shared scan of a frame.
+
+    Register charts with the plot-named methods, which take the same keyword
+    arguments as the plot functions, then call `execute`. The columns all
+    requests reference are collected in a single pass, and `countplot` and
+    `barplot` requests grouping by the same columns share one aggregation.
+    A request whose `estimator` reads other columns lists them in `columns`,
+    which keeps the projection; it is not passed on to the plot function.
+    """
+
+    def __init__(self, data: nwt.IntoFrame) -> None:
+        self._data = nw.from_native(data)
+        self._requests: list[tuple[object, dict, list[str] | None]] = []
+
+    def _add(self, plot, kwargs: dict) -> Plan:
+        # `columns` only feeds the shared projection; the plot never sees it
+        columns = kwargs.pop("columns", None)
+        self._requests.append((plot, kwargs, columns))
+        return self
+
+    def barplot(self, **kwargs) -> Plan:
+        """Register a `barplot` request."""
+        return self._add(barplot, kwargs)
+
+    def countplot(self, **kwargs) -> Plan:
+        """Register a `countplot` request."""
+        return self._add(countplot, kwargs)
+
+    def ecdfplot(self, **kwargs) -> Plan:
+        """Register an `ecdfplot` request."""
+        return self._add(ecdfplot, kwargs)
+
+    def histplot(self, **kwargs) -> Plan:
+        """Register a `histplot` request."""
+        return self._add(histplot, kwargs)
+
+    def kdeplot(self, **kwargs) -> Plan:
+        """Register a `kdeplot` request."""
+        return self._add(kdeplot, kwargs)
+
+    def lineplot(self, **kwargs) -> Plan:
+        """Register a `lineplot` request."""
+        return self._add(lineplot, kwargs)
+
+    def _columns(self) -> list[str] | None:
+        columns: list[str] = []
+        for _, kwargs, extra in self._requests:
+            # An estimator may reference any column unless they are listed
+            if kwargs.get("estimator") is not None and not extra:
+                return None
+            columns += referenced_columns({**kwargs, "columns": extra})
+        return list(dict.fromkeys(columns))
+
+    def _shared_aggregation(self, shared, index: int, plot, kwargs: dict):
+        """Return `(group key, aggregation, rewrite)` for a shareable request."""
+        # A sampled chart draws its own rows, so it cannot share an aggregation
+        if kwargs.get("sample") is not None or kwargs.get("sample_frac") is not None:
+            return None
+        hue = kwargs.get("hue")
+        if plot is countplot:
+            cat_col = kwargs.get("x") or kwargs.get("y")
+            weights = kwargs.get("weights")
+            count = nw.col(weights).sum() if weights else nw.len()
+            alias = f"__count_{index}__"
+
+            def rewrite(view, orders: dict) -> XYChart:
+                view = view.rename({alias: "__weight__"})
+                return countplot(view, **{**kwargs, **orders, "weights": "__weight__"})
+
+            return (cat_col, hue), count.alias(alias), rewrite
+
+        estimator = kwargs.get("estimator")
+        if plot is not barplot or not (
+            estimator is None or isinstance(estimator, nw.Expr)
+        ):
+            return None
+        _, cat_col, num_col = _orientation(
+            shared, kwargs["x"], kwargs["y"], kwargs.get("orient")
+        )
+        agg = estimator if estimator is not None else nw.col(num_col).mean()
+        alias = f"__estimate_{index}__"
+
+        def rewrite(view, orders: dict) -> XYChart:
+            # One row per group, so the default mean returns the shared estimate
+            view = view.rename({alias: num_col})
+            return barplot(view, **{**kwargs, **orders, "estimator": None})
+
+        return (cat_col, hue), agg.alias(alias), rewrite
+
+    def execute(self) -> list[XYChart]:
+        """Compute every registered chart.
+
+        Returns:
+            list[XYChart]: One chart per registered request, in order.
+        """
+        frame = self._data.lazy()
+        columns = self._columns()
+        if columns is not None:
+            frame = frame.select(columns)
+        # The only pass over the source; everything below works on this result
+        shared = frame.collect()
+
+        groups: dict[tuple, list] = {}
+        charts: list[XYChart | None] = []
+        for index, (plot, kwargs, _) in enumerate(self._requests):
+            spec = self._shared_aggregation(shared, index, plot, kwargs)
+            if spec is None:
+                charts.append(plot(shared, **kwargs))
+                continue
+            key, agg, rewrite = spec
+            groups.setdefault(key, []).append((index, kwargs, agg, rewrite))
+            charts.append(None)
+
+        for (cat_col, hue), members in groups.items():
+            keys = [cat_col] + ([hue] if hue else [])
+            result, levels = group_levels(
+                shared, keys, [None] * len(keys), *(agg for _, _, agg, _ in members)
+            )
+            # Default orders, as the plot functions would compute them
+            defaults = dict(zip(["order", "hue_order"], levels))
+            for index, kwargs, _, rewrite in members:
+                orders = {k: v for k, v in defaults.items() if not kwargs.get(k)}
+                charts[index] = rewrite(result, orders)
+        return charts
+
+
+def plan(data: nwt.IntoFrame) -> Plan:
+    """Start a batch of charts computed from one shared scan of `data`.
+
+    Args:
+        data: Input data. Any narwhals-compatible DataFrame or LazyFrame.
+
+    Returns:
+        Plan: A builder; register charts on it and call `execute()`.
+    """
+    return Plan(data)
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import re
+import shutil
+from pathlib import Path
+
+
+def _slugify(text: str) -> str:
+    """Return a GitHub-style heading anchor."""
+    slug = re.sub(r"[^\w\- ]", "", text.strip().lower())
+    return slug.replace(" ", "-")
+
+
+class Report:
+    """A Markdown report that streams headings, text and charts to a file.
+
+    Each block is written to a buffered file handle as soon as it is added, so
+    memory stays at one rendered chart however large the report grows. With
+    `toc=True` only the headings are kept; on close, the table of contents is
+    written and the streamed body is copied after it.
+
+    Use as a context manager:
+
+        with Report("report.md", toc=True) as report:
+            report.heading("Latency")
+            report.chart(histplot(df, x="latency"))
+    """
+
+    def __init__(
+        self, path: str | Path, *, toc: bool = False, buffer_size: int = 1 << 16
+    ) -> None:
+        self._path = Path(path)
+        self._toc = toc
+        self._buffer_size = buffer_size
+        self._body_path = (
+            self._path.with_name(self._path.name + ".part") if toc else self._path
+        )
+        self._file = None
+        self._headings: list[tuple[int, str, str]] = []
+        self._slugs: dict[str, int] = {}
+        self._empty = True
+
+    def __enter__(self) -> Report:
+        return self.open()
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def open(self) -> Report:
+        """Open the output file for streaming. Called by `with` automatically."""
+        self._file = open(
+            self._body_path, "w", encoding="utf-8", buffering=self._buffer_size
+        )
+        return self
+
+    def _write_block(self, block: str) -> Report:
+        if self._file is None:
+            raise ValueError("Report is not open; use it as a context manager")
+        if not self._empty:
+            self._file.write("\n\n")
+        self._file.write(block)
+        self._empty = False
+        return self
+
+    def heading(self, text: str, level: int = 1) -> Report:
+        """Append a Markdown heading."""
+        if not 1 <= level <= 6:
+            raise ValueError(f"level must be between 1 and 6, got {level}")
+        if self._toc:
+            slug = _slugify(text)
+            seen = self._slugs.get(slug, 0)
+            self._slugs[slug] = seen + 1
+            anchor = f"{slug}-{seen}" if seen else slug
+            self._headings.append((level, text, anchor))
+        return self._write_block(f"{'#' * level} {text}")
+
+    def text(self, text: str) -> Report:
+        """Append a paragraph of Markdown text."""
+        return self._write_block(text)
+
+    def chart(self, fig) -> Report:
+        """Append a chart as a fenced Mermaid block and release it."""
+        return self._write_block(str(fig))
+
+    def close(self) -> None:
+        """Flush the report and, if requested, prepend the table of contents."""
+        if self._file is None:
+            return
+        self._file.write("\n")
+        self._file.close()
+        self._file = None
+        if not self._toc:
+            return
+        top = min((level for level, _, _ in self._headings), default=1)
+        with open(self._path, "w", encoding="utf-8") as out:
+            for level, text, anchor in self._headings:
+                out.write(f"{'  ' * (level - top)}- [{text}](#{anchor})\n")
+            if self._headings:
+                out.write("\n")
+            with open(self._body_path, encoding="utf-8") as body:
+                shutil.copyfileobj(body, out, self._buffer_size)
+        self._body_path.unlink()
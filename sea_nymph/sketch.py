@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import math
+import random
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from itertools import accumulate
+
+import narwhals as nw
+
+# Each compactor below the top holds 2/3 of the items of the one above it
+_DECAY = 2 / 3
+
+
+class QuantileSketch:
+    """A mergeable KLL quantile sketch of a numeric stream.
+
+    Values are kept in a stack of compactors; level `h` holds items of weight
+    `2**h`. When the sketch outgrows its budget, the lowest full level is
+    sorted and every other item, from a random offset, is promoted to the
+    level above. Memory stays at about `3k` items however many values are
+    added, and quantiles are accurate to roughly `1.7 / k` in rank.
+
+    Build one sketch per chunk or partition, `merge` them, and pass the result
+    to `histplot(sketch=...)`. The exact count, min, max, mean and variance
+    are tracked alongside, so every statistic a bin rule needs comes from the
+    one pass that built the sketch.
+    """
+
+    def __init__(self, k: int = 200, *, seed: int | None = None) -> None:
+        if k < 8:
+            raise ValueError(f"k must be at least 8, got {k}")
+        self._k = k
+        self._rng = random.Random(seed)
+        self._compactors: list[list[float]] = [[]]
+        self._n = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._min = math.inf
+        self._max = -math.inf
+
+    @property
+    def n(self) -> int:
+        """Number of values added."""
+        return self._n
+
+    @property
+    def min(self) -> float:
+        """Smallest value added (exact)."""
+        return self._min
+
+    @property
+    def max(self) -> float:
+        """Largest value added (exact)."""
+        return self._max
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation of the values added (exact)."""
+        return math.sqrt(self._m2 / (self._n - 1)) if self._n > 1 else 0.0
+
+    def _combine_moments(self, n: int, mean: float, m2: float) -> None:
+        # Chan et al.'s parallel update, so merged moments match one pass
+        total = self._n + n
+        delta = mean - self._mean
+        self._m2 += m2 + delta * delta * self._n * n / total
+        self._mean += delta * n / total
+        self._n = total
+
+    def update(self, values: Iterable[float]) -> QuantileSketch:
+        """Add a batch of values; nulls and NaNs are skipped.
+
+        Args:
+            values: A Series of any narwhals-compatible backend, or an iterable
+                of numbers.
+
+        Returns:
+            QuantileSketch: This sketch, for chaining.
+        """
+        series = nw.from_native(values, series_only=True, pass_through=True)
+        if isinstance(series, nw.Series):
+            values = series.drop_nulls().to_list()
+        batch = [float(v) for v in values if v is not None and not math.isnan(v)]
+        if not batch:
+            return self
+        mean = sum(batch) / len(batch)
+        self._combine_moments(len(batch), mean, sum((v - mean) ** 2 for v in batch))
+        self._min = min(self._min, min(batch))
+        self._max = max(self._max, max(batch))
+        self._compactors[0].extend(batch)
+        self._compress()
+        return self
+
+    def merge(self, other: QuantileSketch) -> QuantileSketch:
+        """Fold `other` into this sketch, as if its values had been added here.
+
+        Args:
+            other: Sketch of another chunk or partition.
+
+        Returns:
+            QuantileSketch: This sketch, for chaining.
+        """
+        if other._n == 0:
+            return self
+        self._combine_moments(other._n, other._mean, other._m2)
+        self._min = min(self._min, other._min)
+        self._max = max(self._max, other._max)
+        while len(self._compactors) < len(other._compactors):
+            self._compactors.append([])
+        for level, items in enumerate(other._compactors):
+            self._compactors[level].extend(items)
+        self._compress()
+        return self
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self._compactors) - level - 1
+        return max(2, math.ceil(self._k * _DECAY**depth))
+
+    def _compress(self) -> None:
+        while sum(map(len, self._compactors)) > sum(
+            self._capacity(h) for h in range(len(self._compactors))
+        ):
+            level = next(
+                h
+                for h, items in enumerate(self._compactors)
+                if len(items) >= self._capacity(h)
+            )
+            if level + 1 == len(self._compactors):
+                self._compactors.append([])
+            items = sorted(self._compactors[level])
+            # An odd item out stays behind, so the total weight is preserved
+            kept = [items.pop()] if len(items) % 2 else []
+            self._compactors[level + 1].extend(items[self._rng.randint(0, 1) :: 2])
+            self._compactors[level] = kept
+
+    def _cumulative(self) -> tuple[list[float], list[int]]:
+        """Return the retained values, sorted, with their cumulative weights."""
+        weighted = sorted(
+            (v, 1 << level)
+            for level, items in enumerate(self._compactors)
+            for v in items
+        )
+        values = [v for v, _ in weighted]
+        return values, list(accumulate(w for _, w in weighted))
+
+    def quantile(self, q: float) -> float:
+        """Return an approximate `q`-quantile of the values added.
+
+        Args:
+            q: Quantile between 0 and 1. The ends return the exact min and max.
+
+        Returns:
+            float: The smallest retained value whose rank reaches `q`.
+
+        Raises:
+            ValueError: If `q` is outside `[0, 1]` or the sketch is empty.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError(f"q must be between 0 and 1, got {q}")
+        if self._n == 0:
+            raise ValueError("quantile of an empty sketch")
+        if q == 0:
+            return self._min
+        if q == 1:
+            return self._max
+        values, weights = self._cumulative()
+        return values[min(bisect_left(weights, q * self._n), len(values) - 1)]
+
+    def histogram(self, edges: list[float]) -> list[float]:
+        """Return approximate counts of the values in each bin.
+
+        Bins are `[edges[i], edges[i + 1])`, the last one closed; values
+        outside `[edges[0], edges[-1]]` are not counted.
+
+        Args:
+            edges: Increasing bin edges.
+
+        Returns:
+            list[float]: One count per bin.
+        """
+        values, weights = self._cumulative()
+
+        def below(edge: float, inclusive: bool = False) -> int:
+            """Return the weight of the retained values below `edge`."""
+            i = (bisect_right if inclusive else bisect_left)(values, edge)
+            return weights[i - 1] if i else 0
+
+        cuts = [below(e) for e in edges[:-1]] + [below(edges[-1], inclusive=True)]
+        return [float(hi - lo) for lo, hi in zip(cuts, cuts[1:])]
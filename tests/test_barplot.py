@@ -114,6 +114,34 @@ class TestHue:
         second_bar = out.index("bar [10")
         assert first_bar < second_bar
 
+    def test_enum_hue_order(self):
+        data = _df(
+            {
+                "category": ["X", "Y", "X", "Y"],
+                "value": [10.0, 20.0, 30.0, 40.0],
+                "group": pl.Series(["a", "a", "b", "b"], dtype=pl.Enum(["b", "a"])),
+            }
+        )
+        fig = barplot(data, x="category", y="value", hue="group")
+        self._figures.append(fig)
+        out = fig.render()
+        assert out.index("bar [30, 40]") < out.index("bar [10, 20]")
+
+    def test_first_seen_order_lazy(self):
+        data = _df(
+            {
+                "category": ["Y", "X", "Y", "X"],
+                "value": [10.0, 20.0, 30.0, 40.0],
+                "group": ["b", "b", "a", "a"],
+            }
+        )
+        fig = barplot(data.lazy(), x="category", y="value", hue="group")
+        self._figures.append(fig)
+        out = fig.render()
+        assert "[Y, X]" in out
+        assert out.index("bar [10, 20]") < out.index("bar [30, 40]")
+        assert out == barplot(data, x="category", y="value", hue="group").render()
+
     def test_palette_list(self):
         fig = barplot(
             self._data(),
@@ -141,6 +169,157 @@ class TestHue:
         assert "#bbbbbb" in out
 
 
+# ---------------------------------------------------------------------------
+# Multiple estimators — one aggregation, one series each
+# ---------------------------------------------------------------------------
+
+
+class TestMultipleEstimators:
+    def _data(self):
+        return _df(
+            {
+                "group": ["A", "A", "B", "B", "C", "C"],
+                "value": [1.0, 3.0, 2.0, 4.0, 5.0, 1.0],
+                "hue": ["a", "b", "a", "b", "a", "b"],
+            }
+        )
+
+    def test_list(self):
+        fig = barplot(
+            self._data(),
+            x="group",
+            y="value",
+            estimator=[nw.col("value").mean(), nw.col("value").max()],
+        )
+        self._figures.append(fig)
+        out = fig.render()
+        assert out.index("bar [2, 3, 3]") < out.index("bar [3, 4, 5]")
+
+    def test_dict_palette(self):
+        fig = barplot(
+            self._data(),
+            x="group",
+            y="value",
+            estimator={"min": nw.col("value").min(), "max": nw.col("value").max()},
+            palette={"min": "#aaaaaa", "max": "#bbbbbb"},
+        )
+        self._figures.append(fig)
+        out = fig.render()
+        assert "bar [1, 2, 1]" in out
+        assert "bar [3, 4, 5]" in out
+        assert "#aaaaaa,#bbbbbb" in out
+
+    def test_with_hue(self):
+        fig = barplot(
+            self._data(),
+            x="group",
+            y="value",
+            hue="hue",
+            estimator=[nw.col("value").sum(), nw.len()],
+        )
+        self._figures.append(fig)
+        out = fig.render()
+        assert out.count("bar [") == 4
+        assert out.index("bar [1, 2, 5]") < out.index("bar [3, 4, 1]")
+
+    def test_empty_raises(self):
+        with pytest.raises(ValueError, match="estimator must not be empty"):
+            barplot(self._data(), x="group", y="value", estimator=[])
+
+
+# ---------------------------------------------------------------------------
+# Sorted order and limit
+# ---------------------------------------------------------------------------
+
+
+class TestSortedOrder:
+    def _data(self):
+        return _df(
+            {
+                "category": ["X", "Y", "Z", "X", "Y", "Z"],
+                "value": [1.0, 5.0, 3.0, 2.0, 1.0, 9.0],
+                "group": ["a", "a", "a", "b", "b", "b"],
+            }
+        )
+
+    def test_descending(self):
+        fig = barplot(self._data(), x="category", y="value", order="descending")
+        self._figures.append(fig)
+        out = fig.render()
+        assert "x-axis [Z, Y, X]" in out
+        assert "bar [6, 3, 1.5]" in out
+
+    def test_ascending_limit_lazy(self):
+        fig = barplot(
+            self._data().lazy(), x="category", y="value", order="ascending", limit=2
+        )
+        self._figures.append(fig)
+        out = fig.render()
+        assert "x-axis [X, Y]" in out
+        assert "bar [1.5, 3]" in out
+
+    def test_horizontal(self):
+        fig = barplot(
+            self._data(), x="value", y="category", order="descending", limit=1
+        )
+        self._figures.append(fig)
+        out = fig.render()
+        assert "x-axis [Z]" in out
+        assert "bar [6]" in out
+
+    def test_order_by_hue(self):
+        fig = barplot(
+            self._data(),
+            x="category",
+            y="value",
+            hue="group",
+            order="descending",
+            order_by_hue="a",
+        )
+        self._figures.append(fig)
+        out = fig.render()
+        assert "x-axis [Y, Z, X]" in out
+        assert "bar [5, 3, 1]" in out
+
+    def test_first_estimator_ranks(self):
+        fig = barplot(
+            self._data(),
+            x="category",
+            y="value",
+            estimator={"min": nw.col("value").min(), "max": nw.col("value").max()},
+            order="descending",
+            limit=2,
+        )
+        self._figures.append(fig)
+        assert "x-axis [Z, X]" in fig.render()  # by min: 3, 1, 1
+
+
+# ---------------------------------------------------------------------------
+# Scan entry points
+# ---------------------------------------------------------------------------
+
+
+class TestScan:
+    def test_from_parquet_with_extra_columns(self, tmp_path):
+        path = tmp_path / "data.parquet"
+        _df(
+            {
+                "group": ["A", "A", "B"],
+                "value": [1.0, 3.0, 2.0],
+                "weight": [2.0, 2.0, 5.0],
+            }
+        ).write_parquet(path)
+        fig = barplot.from_parquet(
+            path,
+            x="group",
+            y="value",
+            estimator=(nw.col("value") * nw.col("weight")).sum().alias("value"),
+            columns=["weight"],
+        )
+        self._figures.append(fig)
+        assert "bar [8, 10]" in fig.render()
+
+
 # ---------------------------------------------------------------------------
 # Errors
 # ---------------------------------------------------------------------------
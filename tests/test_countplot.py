@@ -25,6 +25,39 @@ class TestDataFrame:
         assert "horizontal" not in out
         assert "bar [2, 3, 1]" in out  # A:2, B:3, C:1
 
+    def test_enum_declared_order(self):
+        data = pl.DataFrame(
+            {
+                "size": pl.Series(
+                    ["M", "S", "L", "M"], dtype=pl.Enum(["S", "M", "L", "XL"])
+                )
+            }
+        )
+        fig = countplot(data.lazy(), x="size")
+        self._figures.append(fig)
+        out = fig.render()
+        # Declared order, unobserved XL left out
+        assert "x-axis [S, M, L]" in out
+        assert "bar [1, 2, 1]" in out
+
+    def test_ordered_pandas_categorical(self):
+        pd = pytest.importorskip("pandas")
+        data = pd.DataFrame(
+            {
+                "size": pd.Categorical(
+                    ["M", "S", "M"], categories=["S", "M"], ordered=True
+                )
+            }
+        )
+        fig = countplot(data, x="size")
+        self._figures.append(fig)
+        assert "x-axis [S, M]" in fig.render()
+
+    def test_lazy(self):
+        fig = countplot(self._data().lazy(), x="group")
+        self._figures.append(fig)
+        assert "bar [2, 3, 1]" in fig.render()
+
     def test_basic_count_y(self):
         fig = countplot(self._data(), y="group")
         self._figures.append(fig)
@@ -146,6 +179,122 @@ class TestStat:
         with pytest.raises(ValueError, match="stat must be"):
             countplot(self._data(), x="group", stat="mean")
 
+    def test_weights(self):
+        data = _df({"group": ["A", "B", "B"], "n": [3, 1, 4]})
+        fig = countplot(data, x="group", weights="n", stat="proportion")
+        self._figures.append(fig)
+        assert "bar [0.375, 0.625]" in fig.render()
+
+
+# ---------------------------------------------------------------------------
+# Sorted order and limit
+# ---------------------------------------------------------------------------
+
+
+class TestSortedOrder:
+    def _data(self):
+        return _df(
+            {
+                "group": ["A", "B", "B", "C", "C", "C", "D", "D"],
+                "kind": ["u", "u", "v", "u", "v", "v", "u", "u"],
+            }
+        )
+
+    def test_descending(self):
+        fig = countplot(self._data(), x="group", order="descending")
+        self._figures.append(fig)
+        out = fig.render()
+        assert "x-axis [C, B, D, A]" in out  # ties break on the level
+        assert "bar [3, 2, 2, 1]" in out
+
+    def test_ascending_lazy(self):
+        fig = countplot(self._data().lazy(), x="group", order="ascending")
+        self._figures.append(fig)
+        assert "bar [1, 2, 2, 3]" in fig.render()
+
+    def test_limit(self):
+        fig = countplot(self._data(), x="group", order="descending", limit=2)
+        self._figures.append(fig)
+        out = fig.render()
+        assert "x-axis [C, B]" in out
+        assert "bar [3, 2]" in out
+
+    def test_percent_uses_full_total(self):
+        fig = countplot(
+            self._data(), x="group", order="descending", limit=1, stat="percent"
+        )
+        self._figures.append(fig)
+        assert "bar [37.5]" in fig.render()  # 3 of all 8 rows
+
+    def test_order_by_hue(self):
+        data = _df(
+            {
+                "group": ["A", "A", "A", "B", "B", "B", "B"],
+                "kind": ["u", "u", "v", "u", "v", "v", "v"],
+            }
+        )
+        by_total = countplot(data, x="group", hue="kind", order="descending")
+        by_u = countplot(
+            data, x="group", hue="kind", order="descending", order_by_hue="u"
+        )
+        self._figures.extend([by_total, by_u])
+        assert "x-axis [B, A]" in by_total.render()
+        assert "x-axis [A, B]" in by_u.render()
+
+
+# ---------------------------------------------------------------------------
+# Sampling — approximate charts from a bounded number of rows
+# ---------------------------------------------------------------------------
+
+
+class TestSample:
+    def _data(self):
+        return _df({"group": ["A", "B", "B", "C"] * 250})
+
+    @pytest.mark.parametrize("lazy", [False, True])
+    def test_counts_rescaled(self, lazy):
+        data = _df({"group": ["A"] * 1000})
+        fig = countplot(data.lazy() if lazy else data, x="group", sample=100, seed=0)
+        self._figures.append(fig)
+        out = fig.render()
+        assert 'title "Approximate: 100 of 1,000 rows sampled"' in out
+        assert "bar [1000]" in out
+
+    @pytest.mark.parametrize("lazy", [False, True])
+    def test_seed_reproducible(self, lazy):
+        data = self._data().lazy() if lazy else self._data()
+        first = countplot(data, x="group", sample=50, seed=7)
+        second = countplot(data, x="group", sample=50, seed=7)
+        self._figures.append(first)
+        assert first.render() == second.render()
+
+    def test_sample_frac_lazy(self):
+        fig = countplot(
+            self._data().lazy(),
+            x="group",
+            sample_frac=0.2,
+            seed=0,
+            stat="proportion",
+        )
+        self._figures.append(fig)
+        out = fig.render()
+        assert 'title "Approximate: 20% of rows sampled"' in out
+        heights = [float(v) for v in out.split("bar [")[1].rstrip("]").split(", ")]
+        assert sum(heights) == pytest.approx(1)
+
+    def test_lazy_sample_keeps_source_order(self):
+        data = _df({"group": ["C"] + ["A", "B"] * 500})
+        fig = countplot(data.lazy(), x="group", sample=1001, seed=0)
+        self._figures.append(fig)
+        assert "x-axis [C, A, B]" in fig.render()
+
+    def test_sample_covering_all_rows_is_exact(self):
+        fig = countplot(self._data(), x="group", sample=5000)
+        self._figures.append(fig)
+        out = fig.render()
+        assert "title" not in out
+        assert "bar [250, 500, 250]" in out
+
 
 # ---------------------------------------------------------------------------
 # Errors
@@ -160,3 +309,27 @@ class TestErrors:
     def test_neither_x_nor_y(self):
         with pytest.raises(ValueError, match="exactly one of x or y"):
             countplot(_df({"g": ["A"]}))
+
+    def test_invalid_order(self):
+        with pytest.raises(ValueError, match="order must be a list or one of"):
+            countplot(_df({"g": ["A"]}), x="g", order="largest")
+
+    def test_limit_without_sorted_order(self):
+        with pytest.raises(ValueError, match="limit requires order"):
+            countplot(_df({"g": ["A"]}), x="g", limit=1)
+
+    def test_limit_below_one(self):
+        with pytest.raises(ValueError, match="limit must be at least 1"):
+            countplot(_df({"g": ["A"]}), x="g", order="descending", limit=0)
+
+    def test_sample_and_sample_frac(self):
+        with pytest.raises(ValueError, match="at most one of sample or sample_frac"):
+            countplot(_df({"g": ["A"]}), x="g", sample=1, sample_frac=0.5)
+
+    def test_sample_below_one(self):
+        with pytest.raises(ValueError, match="sample must be at least 1"):
+            countplot(_df({"g": ["A"]}), x="g", sample=0)
+
+    def test_sample_frac_out_of_range(self):
+        with pytest.raises(ValueError, match=r"sample_frac must be in \(0, 1\]"):
+            countplot(_df({"g": ["A"]}), x="g", sample_frac=1.5)
@@ -0,0 +1,168 @@
+import re
+
+import pytest
+import polars as pl
+
+from sea_nymph import ecdfplot
+
+
+def _df(data: dict):
+    return pl.DataFrame(data)
+
+
+def _data():
+    return _df({"x": [0.0, 1.0, 1.0, 2.0, 3.0, 4.0]})
+
+
+def _series_values(out: str) -> list[float]:
+    return [float(v) for v in re.search(r"line \[([^\]]+)\]", out).group(1).split(", ")]
+
+
+# ---------------------------------------------------------------------------
+# Basic rendering
+# ---------------------------------------------------------------------------
+
+
+class TestBasic:
+    def test_basic(self):
+        fig = ecdfplot(_data(), x="x", gridsize=5)
+        self._figures.append(fig)
+        out = fig.render()
+        assert "xychart-beta\n" in out
+        assert 'x-axis "x" 0 --> 4' in out
+        # grid 0..4: F(0)=1/6, F(1)=3/6, F(2)=4/6, F(3)=5/6, F(4)=1
+        assert _series_values(out) == pytest.approx([1 / 6, 3 / 6, 4 / 6, 5 / 6, 1.0])
+
+    def test_returns_xychart(self):
+        from sea_nymph.mermaidplotlib import XYChart
+
+        assert isinstance(ecdfplot(_data(), x="x"), XYChart)
+
+    def test_default_gridsize(self):
+        fig = ecdfplot(_data(), x="x")
+        self._figures.append(fig)
+        assert len(_series_values(fig.render())) == 200
+
+    def test_monotonic(self):
+        fig = ecdfplot(_data(), x="x", gridsize=37)
+        self._figures.append(fig)
+        values = _series_values(fig.render())
+        assert values == sorted(values)
+        assert values[-1] == 1.0
+
+    def test_values_between_grid_points(self):
+        df = _df({"x": [0.0, 0.4, 0.6, 2.0]})
+        fig = ecdfplot(df, x="x", gridsize=3)
+        self._figures.append(fig)
+        # grid 0, 1, 2: 0.4 and 0.6 both count from grid point 1 onwards
+        assert _series_values(fig.render()) == [0.25, 0.75, 1.0]
+
+    def test_constant_column(self):
+        fig = ecdfplot(_df({"x": [2.0, 2.0, 2.0]}), x="x", gridsize=5)
+        self._figures.append(fig)
+        out = fig.render()
+        assert 'x-axis "x" 1.5 --> 2.5' in out
+        assert _series_values(out) == [0, 0, 1, 1, 1]
+
+    def test_horizontal(self):
+        fig = ecdfplot(_data(), y="x", gridsize=5)
+        self._figures.append(fig)
+        out = fig.render()
+        assert "xychart-beta horizontal" in out
+        assert '"Proportion"' in out
+
+
+# ---------------------------------------------------------------------------
+# Stat
+# ---------------------------------------------------------------------------
+
+
+class TestStat:
+    def test_stat_count(self):
+        fig = ecdfplot(_data(), x="x", gridsize=5, stat="count")
+        self._figures.append(fig)
+        assert "line [1, 3, 4, 5, 6]" in fig.render()
+
+    def test_stat_percent(self):
+        fig = ecdfplot(_data(), x="x", gridsize=5, stat="percent")
+        self._figures.append(fig)
+        assert _series_values(fig.render())[-1] == 100
+
+    def test_complementary(self):
+        fig = ecdfplot(_data(), x="x", gridsize=5, stat="count", complementary=True)
+        self._figures.append(fig)
+        assert "line [5, 3, 2, 1, 0]" in fig.render()
+
+    def test_sampled_count_rescaled(self):
+        data = _df({"x": [float(i % 5) for i in range(1000)]})
+        fig = ecdfplot(data, x="x", gridsize=5, stat="count", sample=50, seed=0)
+        self._figures.append(fig)
+        assert _series_values(fig.render())[-1] == 1000
+
+    def test_stat_invalid(self):
+        with pytest.raises(ValueError, match="stat must be"):
+            ecdfplot(_data(), x="x", stat="density")
+
+
+# ---------------------------------------------------------------------------
+# Hue
+# ---------------------------------------------------------------------------
+
+
+class TestHue:
+    def _data(self):
+        return _df(
+            {
+                "x": [0.0, 1.0, 2.0, 2.0, 3.0, 4.0],
+                "grp": ["a", "a", "a", "b", "b", "b"],
+            }
+        )
+
+    def test_hue_two_series(self):
+        fig = ecdfplot(self._data(), x="x", hue="grp", gridsize=5, stat="count")
+        self._figures.append(fig)
+        out = fig.render()
+        assert "line [1, 2, 3, 3, 3]" in out
+        assert "line [0, 0, 1, 2, 3]" in out
+
+    def test_hue_order(self):
+        fig = ecdfplot(self._data(), x="x", hue="grp", hue_order=["b", "a"], gridsize=5)
+        self._figures.append(fig)
+        out = fig.render()
+        assert out.index("line [0,") < out.index("line [0.33")
+
+    @pytest.mark.parametrize("stat", ["proportion", "percent", "count"])
+    def test_empty_hue_level_is_zero(self, stat):
+        fig = ecdfplot(
+            self._data(), x="x", hue="grp", hue_order=["a", "z"], gridsize=5, stat=stat
+        )
+        self._figures.append(fig)
+        assert "line [0, 0, 0, 0, 0]" in fig.render()
+
+    def test_palette_list(self):
+        fig = ecdfplot(
+            self._data(), x="x", hue="grp", palette=["#ff0000", "#00ff00"], gridsize=5
+        )
+        self._figures.append(fig)
+        out = fig.render()
+        assert "#ff0000" in out
+        assert "#00ff00" in out
+
+
+# ---------------------------------------------------------------------------
+# Errors
+# ---------------------------------------------------------------------------
+
+
+class TestErrors:
+    def test_missing_column(self):
+        with pytest.raises(ValueError, match="Column 'z' not found"):
+            ecdfplot(_data(), x="z")
+
+    def test_both_x_and_y(self):
+        with pytest.raises(ValueError, match="exactly one of x or y"):
+            ecdfplot(_data(), x="x", y="x")
+
+    def test_gridsize_too_small(self):
+        with pytest.raises(ValueError, match="gridsize must be at least 2"):
+            ecdfplot(_data(), x="x", gridsize=1)
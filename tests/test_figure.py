@@ -1,6 +1,7 @@
 import pytest
+import polars as pl
 
-from sea_nymph.mermaidplotlib import XYChart
+from sea_nymph.mermaidplotlib import LiveChart, XYChart
 
 
 # ---------------------------------------------------------------------------
@@ -325,6 +326,120 @@ class TestNumberFormatting:
         out = fig.render()
         assert "bar [-5, -3]" in out
 
+    def test_render_precision(self):
+        fig = XYChart().line(["A", "B", "C"], [0.030234567891234567, 1.5, -0.0001])
+        self._figures.append(fig)
+        out = fig.render(precision=3)
+        assert "line [0.03, 1.5, 0]" in out
+
+    def test_render_sig_digits(self):
+        fig = XYChart().line(["A", "B", "C"], [0.030234567891234567, 123456.0, 4.5e-07])
+        out = fig.render(sig_digits=3)
+        assert "line [0.0302, 123000, 0.00000045]" in out
+
+    def test_chart_default(self):
+        fig = XYChart(sig_digits=2).bar(["A", "B"], [1.234, 5.678])
+        self._figures.append(fig)
+        assert "bar [1.2, 5.7]" in fig.render()
+        assert "bar [1.23, 5.68]" in fig.render(precision=2)
+        assert "bar [1.234, 5.678]" in fig.precision().render()
+
+    def test_precision_and_sig_digits_raises(self):
+        with pytest.raises(ValueError, match="at most one of precision or sig_digits"):
+            XYChart().precision(2, sig_digits=3)
+
+
+# ---------------------------------------------------------------------------
+# Vector inputs — Series and arrays are validated vectorized, kept uncopied
+# ---------------------------------------------------------------------------
+
+
+class TestVectorInputs:
+    def test_polars_series(self):
+        x, y = pl.Series([0, 1, 2]), pl.Series([1.5, 2.0, 3.0])
+        fig = XYChart().line(x, y)
+        self._figures.append(fig)
+        assert fig.render() == XYChart().line([0, 1, 2], [1.5, 2.0, 3.0]).render()
+
+    def test_series_categories(self):
+        fig = XYChart().bar(pl.Series(["A", "B"]), pl.Series([3, 4]))
+        self._figures.append(fig)
+        out = fig.render()
+        assert "x-axis [A, B]" in out
+        assert "bar [3, 4]" in out
+
+    def test_numpy_array_kept(self):
+        np = pytest.importorskip("numpy")
+        y = np.array([1.0, 2.5, 4.0])
+        fig = XYChart().line(np.arange(3), y)
+        self._figures.append(fig)
+        assert np.shares_memory(fig._series[0][1], y)
+        assert not fig._series[0][1].flags.writeable
+        assert "line [1, 2.5, 4]" in fig.render()
+
+    def test_numpy_array_aliased(self):
+        np = pytest.importorskip("numpy")
+        y = np.array([1.0, 2.0])
+        fig = XYChart().bar(["A", "B"], y)
+        y[0] = 99.0
+        self._figures.append(fig)
+        assert "bar [99, 2]" in fig.render()
+
+    def test_nan_written_after_add_raises(self):
+        np = pytest.importorskip("numpy")
+        y = np.array([1.0, 2.0])
+        fig = XYChart().bar(["A", "B"], y)
+        y[1] = np.nan
+        with pytest.raises(ValueError, match=r"data\[1\] is not finite"):
+            fig.render()
+
+    def test_buffer_protocol(self):
+        pytest.importorskip("numpy")
+        from array import array
+
+        fig = XYChart().bar(["A", "B"], array("d", [1.0, 2.5]))
+        self._figures.append(fig)
+        assert "bar [1, 2.5]" in fig.render()
+
+    def test_uneven_series_raises(self):
+        with pytest.raises(ValueError, match="not evenly spaced"):
+            XYChart().line(pl.Series([0.0, 1.0, 3.0]), [1, 2, 3])
+
+    def test_null_in_series_raises(self):
+        with pytest.raises(TypeError, match=r"data\[1\] is not numeric"):
+            XYChart().bar(["A", "B"], pl.Series([1.0, None]))
+
+    def test_unsigned_array_gaps_do_not_wrap(self):
+        np = pytest.importorskip("numpy")
+        with pytest.raises(ValueError, match="not evenly spaced"):
+            XYChart().line(np.array([0, 128, 0], dtype=np.uint8), [1, 1, 1])
+
+    def test_unsigned_array_evenly_spaced(self):
+        np = pytest.importorskip("numpy")
+        fig = XYChart().line(np.array([0, 100, 200], dtype=np.uint8), [1, 2, 3])
+        self._figures.append(fig)
+        assert "x-axis 0 --> 200" in fig.render()
+
+    def test_decimal_series(self):
+        from decimal import Decimal
+
+        y = pl.Series([Decimal("1.5"), Decimal("2")])
+        fig = XYChart().bar(["A", "B"], y)
+        self._figures.append(fig)
+        assert "bar [1.5, 2]" in fig.render()
+
+    def test_integer_series_kept(self):
+        y = pl.Series([1, 2], dtype=pl.Int16)
+        fig = XYChart().bar(["A", "B"], y)
+        self._figures.append(fig)
+        assert not isinstance(fig._series[0][1], list)  # kept, not coerced
+        assert "bar [1, 2]" in fig.render()
+
+    def test_nan_in_array_raises(self):
+        np = pytest.importorskip("numpy")
+        with pytest.raises(ValueError, match=r"data\[1\] is not finite"):
+            XYChart().bar(["A", "B"], np.array([1.0, np.nan]))
+
 
 # ---------------------------------------------------------------------------
 # Colors
@@ -381,6 +496,114 @@ class TestColors:
         assert out.index("%%{init:") < out.index("xychart-beta")
 
 
+# ---------------------------------------------------------------------------
+# LiveChart — rolling ring buffers
+# ---------------------------------------------------------------------------
+
+
+class TestLiveChart:
+    def test_append_numeric(self):
+        fig = LiveChart(capacity=5).add_line().add_bar()
+        for t in range(3):
+            fig.append(t, t * 10, t + 1)
+        self._figures.append(fig)
+        out = fig.render()
+        assert "x-axis 0 --> 2" in out
+        assert "line [0, 10, 20]" in out
+        assert "bar [1, 2, 3]" in out
+
+    def test_rolls_at_capacity(self):
+        fig = LiveChart(capacity=3).add_line()
+        for t in range(10):
+            fig.append(t * 0.5, t)
+        self._figures.append(fig)
+        out = fig.render()
+        assert len(fig) == 3
+        assert "x-axis 3.5 --> 4.5" in out
+        assert "line [7, 8, 9]" in out
+
+    def test_matches_xychart(self):
+        fig = LiveChart(capacity=4).add_line(color="#ff0000").xlabel("t").ylim(0, 9)
+        for t in range(6):
+            fig.append(t, t + 0.5)
+        self._figures.append(fig)
+        expected = (
+            XYChart()
+            .line([2, 3, 4, 5], [2.5, 3.5, 4.5, 5.5], color="#ff0000")
+            .xlabel("t")
+            .ylim(0, 9)
+        )
+        assert fig.render() == expected.render()
+
+    def test_categorical_x(self):
+        fig = LiveChart(capacity=2).add_bar()
+        for label, v in [("Mon", 1), ("Tue", 2), ("Wed day", 3)]:
+            fig.append(label, v)
+        self._figures.append(fig)
+        out = fig.render()
+        assert 'x-axis [Tue, "Wed day"]' in out
+        assert "bar [2, 3]" in out
+
+    def test_title(self):
+        fig = LiveChart(capacity=2, title="Live").add_line().append(0, 1)
+        self._figures.append(fig)
+        assert 'title "Live"' in fig.render()
+
+    def test_uneven_step_raises(self):
+        fig = LiveChart(capacity=5).add_line().append(0, 1).append(1, 1)
+        with pytest.raises(ValueError, match="does not continue the step"):
+            fig.append(3, 1)
+
+    def test_wrong_value_count_raises(self):
+        fig = LiveChart(capacity=5).add_line().add_line()
+        with pytest.raises(ValueError, match="expected 2 values"):
+            fig.append(0, 1)
+
+    def test_non_finite_raises(self):
+        with pytest.raises(ValueError, match="not finite"):
+            LiveChart(capacity=5).add_line().append(0, float("nan"))
+
+    @pytest.mark.parametrize("x", [float("nan"), float("inf"), float("-inf")])
+    def test_non_finite_x_raises(self, x):
+        fig = LiveChart(capacity=5).add_line().append(0, 1.0)
+        with pytest.raises(ValueError, match="x is not finite"):
+            fig.append(x, 2.0)
+        # Rejected before any state changed: the step is still free to set
+        fig.append(2, 3.0).append(4, 4.0)
+        self._figures.append(fig)
+        out = fig.render()
+        assert "x-axis 0 --> 4" in out
+        assert "line [1, 3, 4]" in out
+
+    def test_non_finite_first_x_raises(self):
+        fig = LiveChart(capacity=5).add_line()
+        with pytest.raises(ValueError, match="x is not finite"):
+            fig.append(float("nan"), 1.0)
+        assert len(fig) == 0
+
+    def test_declare_after_append_raises(self):
+        fig = LiveChart(capacity=5).add_line().append(0, 1)
+        with pytest.raises(ValueError, match="declared before the first append"):
+            fig.add_bar()
+
+    def test_static_series_methods_raise(self):
+        with pytest.raises(TypeError, match="add_bar/add_line"):
+            LiveChart(capacity=5).line([0, 1], [1, 2])
+
+    def test_empty_render_raises(self):
+        with pytest.raises(ValueError, match="no data"):
+            LiveChart(capacity=5).add_line().render()
+
+    def test_precision_applied_on_append(self):
+        fig = LiveChart(capacity=3, precision=2).add_line().append(0, 1 / 3)
+        self._figures.append(fig)
+        assert "line [0.33]" in fig.render()
+        with pytest.raises(ValueError, match="before the first append"):
+            fig.precision(4)
+        with pytest.raises(TypeError, match="formats values on append"):
+            fig.render(precision=4)
+
+
 # ---------------------------------------------------------------------------
 # Validation errors — no figures saved (all tests expect exceptions)
 # ---------------------------------------------------------------------------
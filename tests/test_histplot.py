@@ -1,9 +1,10 @@
 import re
 
 import pytest
+import narwhals as nw
 import polars as pl
 
-from sea_nymph import histplot
+from sea_nymph import QuantileSketch, histplot
 
 
 def _df(data: dict):
@@ -87,6 +88,54 @@ class TestBins:
         self._figures.append(fig)
         assert "bar [1, 1]" in fig.render()  # 5.0 is outside range
 
+    def test_bins_rule_sturges(self):
+        # 16 values: log2(16) + 1 = 5 bins
+        df = _df({"x": [float(i) for i in range(16)]})
+        fig = histplot(df, x="x", bins="sturges")
+        self._figures.append(fig)
+        values = re.search(r"bar \[([^\]]+)\]", fig.render()).group(1).split(", ")
+        assert len(values) == 5
+
+    def test_bins_rule_sqrt(self):
+        df = _df({"x": [float(i) for i in range(16)]})
+        fig = histplot(df, x="x", bins="sqrt")
+        self._figures.append(fig)
+        values = re.search(r"bar \[([^\]]+)\]", fig.render()).group(1).split(", ")
+        assert len(values) == 4
+
+    def test_bins_rule_fd(self):
+        # IQR = 7.5, width = 2 * 7.5 / 16 ** (1/3) ≈ 5.95 → ceil(15 / 5.95) = 3
+        df = _df({"x": [float(i) for i in range(16)]})
+        fig = histplot(df, x="x", bins="fd")
+        self._figures.append(fig)
+        values = re.search(r"bar \[([^\]]+)\]", fig.render()).group(1).split(", ")
+        assert len(values) == 3
+
+    def test_bins_rule_auto(self):
+        # Sturges is narrower than FD here: ceil(log2(10) + 1) = 5 bins
+        fig = histplot(_data(), x="x", bins="auto")
+        self._figures.append(fig)
+        values = re.search(r"bar \[([^\]]+)\]", fig.render()).group(1).split(", ")
+        assert len(values) == 5
+
+    @pytest.mark.parametrize("rule", ["fd", "auto"])
+    def test_bins_rule_heavy_tail_raises(self, rule):
+        # Lognormal-like latencies plus one extreme outlier
+        body = [1.0 + (i % 100) / 10 for i in range(10_000)]
+        df = _df({"x": body + [1e7]})
+        with pytest.raises(ValueError, match=f"bins='{rule}' would give"):
+            histplot(df, x="x", bins=rule)
+
+    def test_bins_rule_heavy_tail_binrange(self):
+        body = [1.0 + (i % 100) / 10 for i in range(10_000)]
+        fig = histplot(_df({"x": body + [1e7]}), x="x", bins="fd", binrange=(1, 11))
+        self._figures.append(fig)
+        assert "bar [" in fig.render()
+
+    def test_bins_rule_invalid(self):
+        with pytest.raises(ValueError, match="bins must be one of"):
+            histplot(_data(), x="x", bins="doane")
+
     def test_discrete(self):
         df = _df({"x": [1, 1, 2, 3, 3, 3]})
         fig = histplot(df, x="x", discrete=True)
@@ -147,6 +196,34 @@ class TestStat:
             histplot(self._data(), x="x", stat="mean")
 
 
+# ---------------------------------------------------------------------------
+# Weights
+# ---------------------------------------------------------------------------
+
+
+class TestWeights:
+    def test_weights_match_expanded_rows(self):
+        compressed = _df({"x": [0.5, 1.5], "n": [3, 1]})
+        expanded = _df({"x": [0.5, 0.5, 0.5, 1.5]})
+        fig = histplot(compressed, x="x", weights="n", bins=2, binrange=(0.0, 2.0))
+        self._figures.append(fig)
+        expected = histplot(expanded, x="x", bins=2, binrange=(0.0, 2.0))
+        assert fig.render() == expected.render()
+        assert "bar [3, 1]" in fig.render()
+
+    def test_weights_normalise_by_total_weight(self):
+        df = _df({"x": [0.5, 1.5], "n": [3, 1]})
+        fig = histplot(
+            df, x="x", weights="n", bins=2, binrange=(0.0, 2.0), stat="percent"
+        )
+        self._figures.append(fig)
+        assert "bar [75, 25]" in fig.render()
+
+    def test_missing_weights_column(self):
+        with pytest.raises(ValueError, match="Column 'w' not found"):
+            histplot(_data(), x="x", weights="w")
+
+
 # ---------------------------------------------------------------------------
 # Hue
 # ---------------------------------------------------------------------------
@@ -180,6 +257,14 @@ class TestHue:
         # b: bin0=1, bin1=2  /  a: bin0=2, bin1=1 — b first
         assert out.index("bar [1") < out.index("bar [2")
 
+    def test_level_outside_binrange(self):
+        data = _df({"x": [5.0, 0.5, 1.5], "grp": ["c", "a", "a"]})
+        fig = histplot(data.lazy(), x="x", bins=2, binrange=(0.0, 2.0), hue="grp")
+        self._figures.append(fig)
+        out = fig.render()
+        # c is seen first, though none of its values fall inside the range
+        assert out.index("bar [0, 0]") < out.index("bar [1, 1]")
+
     def test_palette_list(self):
         fig = histplot(
             self._data(),
@@ -195,6 +280,189 @@ class TestHue:
         assert "#00ff00" in out
 
 
+# ---------------------------------------------------------------------------
+# Cumulative and multiple — computed in the engine
+# ---------------------------------------------------------------------------
+
+
+class TestCumulative:
+    def test_count(self):
+        fig = histplot(_data(), x="x", bins=3, binrange=(0.0, 3.0), cumulative=True)
+        self._figures.append(fig)
+        assert "bar [4, 7, 10]" in fig.render()
+
+    def test_density_accumulates_area(self):
+        fig = histplot(
+            _data(),
+            x="x",
+            bins=3,
+            binrange=(0.0, 3.0),
+            cumulative=True,
+            stat="density",
+        )
+        self._figures.append(fig)
+        assert "bar [0.4, 0.7, 1]" in fig.render()
+
+    def test_per_hue(self):
+        data = _df({"x": [0.5, 1.5, 1.5, 0.5], "grp": ["a", "a", "a", "b"]})
+        fig = histplot(
+            data, x="x", bins=2, binrange=(0.0, 2.0), hue="grp", cumulative=True
+        )
+        self._figures.append(fig)
+        out = fig.render()
+        assert "bar [1, 3]" in out
+        assert "bar [1, 1]" in out
+
+
+class TestMultiple:
+    def _data(self):
+        # a: bin0=2, bin1=1  /  b: bin0=1, bin1=3
+        return _df(
+            {
+                "x": [0.5, 0.5, 1.5, 0.5, 1.5, 1.5, 1.5],
+                "grp": ["a", "a", "a", "b", "b", "b", "b"],
+            }
+        )
+
+    def _plot(self, data, **kwargs):
+        return histplot(data, x="x", bins=2, binrange=(0.0, 2.0), hue="grp", **kwargs)
+
+    def test_stack_top_first(self):
+        fig = self._plot(self._data(), multiple="stack")
+        self._figures.append(fig)
+        assert "bar [3, 4]\n    bar [2, 1]" in fig.render()
+
+    def test_stack_colours_follow_levels(self):
+        fig = self._plot(self._data(), multiple="stack", palette=["#a00", "#0b0"])
+        self._figures.append(fig)
+        assert "'#0b0,#a00'" in fig.render()
+
+    def test_fill(self):
+        fig = self._plot(self._data().lazy(), multiple="fill", hue_order=["b", "a"])
+        self._figures.append(fig)
+        assert "bar [1, 1]\n    bar [0.3333333333333333, 0.75]" in fig.render()
+
+    def test_stack_with_stat(self):
+        fig = self._plot(self._data(), multiple="stack", stat="percent")
+        self._figures.append(fig)
+        out = fig.render(precision=2)
+        assert "bar [42.86, 57.14]\n    bar [28.57, 14.29]" in out
+
+    def test_invalid(self):
+        with pytest.raises(ValueError, match="multiple must be one of"):
+            self._plot(self._data(), multiple="dodge")
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{}, {"multiple": "stack"}, {"multiple": "fill"}, {"cumulative": True}],
+        ids=["overlay", "stack", "fill", "cumulative"],
+    )
+    @pytest.mark.parametrize(
+        "hue_order", [None, ["b", "z", "a"]], ids=["seen", "given"]
+    )
+    def test_pyarrow_matches_polars(self, kwargs, hue_order):
+        pa = pytest.importorskip("pyarrow")
+        data = self._data()
+        kwargs = {**kwargs, "hue_order": hue_order}
+        # Both plain `string` and polars' `large_string` hue columns
+        for table in (pa.table(data.to_dict(as_series=False)), data.to_arrow()):
+            fig = self._plot(table, **kwargs)
+            assert fig.render() == self._plot(data, **kwargs).render()
+        self._figures.append(fig)
+
+
+class TestSample:
+    def test_counts_rescaled(self):
+        data = _df({"x": [0.5] * 600 + [1.5] * 400})
+        fig = histplot(
+            data.lazy(), x="x", bins=2, binrange=(0.0, 2.0), sample=100, seed=0
+        )
+        self._figures.append(fig)
+        out = fig.render()
+        assert "Approximate: 100 of 1,000 rows sampled" in out
+        heights = [float(v) for v in out.split("bar [")[1].rstrip("]\n").split(", ")]
+        assert sum(heights) == 1000
+
+
+class TestSketch:
+    def _data(self):
+        return _df({"x": [float(i % 50) for i in range(5000)]})
+
+    def test_sketch_chooses_bins(self):
+        data = self._data()
+        sketch = QuantileSketch(seed=0).update(data["x"])
+        fig = histplot(data, x="x", bins="sturges", sketch=sketch)
+        self._figures.append(fig)
+        assert fig.render() == histplot(data, x="x", bins="sturges").render()
+
+    def test_sketch_alone(self):
+        data = self._data()
+        sketch = QuantileSketch(seed=0)
+        for chunk in (data[:2500], data[2500:]):
+            sketch.merge(QuantileSketch(seed=1).update(chunk["x"]))
+        fig = histplot(sketch=sketch, x="x", bins=5, stat="proportion")
+        self._figures.append(fig)
+        out = fig.render()
+        assert 'title "Approximate: quantile sketch of 5,000 values"' in out
+        heights = [float(v) for v in out.split("bar [")[1].rstrip("]\n").split(", ")]
+        assert heights == pytest.approx([0.2] * 5, abs=0.03)
+
+    def test_sketch_alone_with_hue_raises(self):
+        sketch = QuantileSketch().update([1.0, 2.0])
+        with pytest.raises(ValueError, match="need data, not a sketch"):
+            histplot(sketch=sketch, x="x", hue="grp")
+
+    def test_no_data_or_sketch(self):
+        with pytest.raises(ValueError, match="data or sketch must be provided"):
+            histplot(x="x")
+
+
+# ---------------------------------------------------------------------------
+# Scan entry points — read only the referenced columns
+# ---------------------------------------------------------------------------
+
+
+class TestScan:
+    def _frame(self):
+        return _df(
+            {
+                "x": [0.5, 0.5, 1.5, 1.5, 0.5, 1.5],
+                "grp": ["a", "a", "a", "b", "b", "b"],
+                "unused": ["u"] * 6,
+            }
+        )
+
+    def test_from_parquet(self, tmp_path):
+        path = tmp_path / "data.parquet"
+        self._frame().write_parquet(path)
+        fig = histplot.from_parquet(path, x="x", bins=2, binrange=(0.0, 2.0))
+        self._figures.append(fig)
+        assert "bar [3, 3]" in fig.render()
+
+    def test_from_csv_with_where_and_hue(self, tmp_path):
+        path = tmp_path / "data.csv"
+        self._frame().write_csv(path)
+        fig = histplot.from_csv(
+            path,
+            x="x",
+            hue="grp",
+            where=nw.col("x") < 1,
+            bins=2,
+            binrange=(0.0, 2.0),
+        )
+        self._figures.append(fig)
+        out = fig.render()
+        assert "bar [2, 0]" in out
+        assert "bar [1, 0]" in out
+
+    def test_matches_in_memory(self, tmp_path):
+        path = tmp_path / "data.parquet"
+        self._frame().write_parquet(path)
+        fig = histplot.from_parquet(path, x="x", hue="grp", bins=2)
+        expected = histplot(self._frame(), x="x", hue="grp", bins=2)
+        assert fig.render() == expected.render()
+
+
 # ---------------------------------------------------------------------------
 # Errors
 # ---------------------------------------------------------------------------
@@ -1,4 +1,5 @@
 import re
+from statistics import NormalDist
 
 import pytest
 import polars as pl
@@ -89,6 +90,40 @@ class TestBasic:
         assert float(no_cut_range.group(1)) > float(cut_range.group(1))
 
 
+# ---------------------------------------------------------------------------
+# Weights
+# ---------------------------------------------------------------------------
+
+
+class TestWeights:
+    def test_unit_weights_match_unweighted(self):
+        df = _data().with_columns(pl.lit(1.0).alias("w"))
+        fig = kdeplot(df, x="x", weights="w", gridsize=20)
+        self._figures.append(fig)
+        expected = _series_values(kdeplot(_data(), x="x", gridsize=20).render())
+        assert _series_values(fig.render()) == pytest.approx(expected)
+
+    def test_weights_shift_mass(self):
+        df = _df({"x": [1.0, 2.0, 9.0, 10.0], "w": [10.0, 10.0, 1.0, 1.0]})
+        fig = kdeplot(df, x="x", weights="w", gridsize=50)
+        self._figures.append(fig)
+        values = _series_values(fig.render())
+        # heavily weighted low values pull the peak into the left half
+        assert values.index(max(values)) < 25
+
+    def test_weighted_density_integrates_to_one(self):
+        df = _df({"x": [1.0, 2.0, 3.0, 6.0], "w": [5.0, 1.0, 2.0, 4.0]})
+        fig = kdeplot(df, x="x", weights="w", gridsize=200)
+        out = fig.render()
+        lo, hi = (
+            float(v)
+            for v in re.search(r"x-axis [^\n]*?([\d.\-]+) --> ([\d.\-]+)", out).groups()
+        )
+        values = _series_values(out)
+        step = (hi - lo) / (len(values) - 1)
+        assert sum(values) * step == pytest.approx(1.0, abs=1e-3)
+
+
 # ---------------------------------------------------------------------------
 # Hue
 # ---------------------------------------------------------------------------
@@ -118,6 +153,16 @@ class TestHue:
         a_values = [float(v) for v in lines[1].split(", ")]
         assert b_values.index(max(b_values)) > a_values.index(max(a_values))
 
+    @pytest.mark.parametrize("kernel", ["gaussian", "epanechnikov"])
+    def test_n_jobs_matches_serial(self, kernel):
+        data = _df(
+            {"x": [float(i % 13) for i in range(60)], "grp": list("abcdef") * 10}
+        )
+        serial = kdeplot(data, x="x", hue="grp", kernel=kernel, gridsize=30)
+        threaded = kdeplot(data, x="x", hue="grp", kernel=kernel, gridsize=30, n_jobs=4)
+        self._figures.append(threaded)
+        assert threaded.render() == serial.render()
+
     def test_palette_list(self):
         fig = kdeplot(
             self._data(), x="x", hue="grp", palette=["#ff0000", "#00ff00"], gridsize=20
@@ -141,6 +186,287 @@ class TestHue:
         assert "#bbbbbb" in out
 
 
+# ---------------------------------------------------------------------------
+# Bandwidth selectors
+# ---------------------------------------------------------------------------
+
+
+def _bimodal():
+    return _df({"x": [i / 10 for i in range(50)] + [20 + i / 10 for i in range(50)]})
+
+
+class TestBandwidth:
+    def test_scott_narrower_than_silverman(self):
+        fig_scott = kdeplot(_data(), x="x", bw_method="scott", gridsize=50)
+        fig_silverman = kdeplot(_data(), x="x", bw_method="silverman", gridsize=50)
+        self._figures.append(fig_scott)
+        peak_scott = max(_series_values(fig_scott.render()))
+        assert peak_scott > max(_series_values(fig_silverman.render()))
+
+    def test_isj_resolves_modes(self):
+        fig_isj = kdeplot(_bimodal(), x="x", bw_method="isj", gridsize=50)
+        fig_silverman = kdeplot(_bimodal(), x="x", gridsize=50)
+        self._figures.append(fig_isj)
+        self._figures.append(fig_silverman)
+        # A narrower bandwidth keeps the two clusters apart: higher peaks
+        peak_isj = max(_series_values(fig_isj.render()))
+        assert peak_isj > 2 * max(_series_values(fig_silverman.render()))
+
+    def test_isj_close_to_silverman_for_normal_data(self):
+        import narwhals as nw
+
+        from sea_nymph.kdeplot import _isj_bandwidth, _rule_bandwidth
+
+        normal = [NormalDist().inv_cdf((i + 0.5) / 500) for i in range(500)]
+        data = nw.from_native(_df({"x": normal}))
+        ratio = _isj_bandwidth(data, "x") / _rule_bandwidth(data, "x", 1.06)
+        assert 0.7 < ratio < 1.3
+
+    def test_isj_integrates_to_one(self):
+        fig = kdeplot(_bimodal(), x="x", bw_method="isj", gridsize=200)
+        out = fig.render()
+        lo, hi = (
+            float(v) for v in re.search(r"x-axis \S+ (\S+) --> (\S+)", out).groups()
+        )
+        values = _series_values(out)
+        assert sum(values) * (hi - lo) / (len(values) - 1) == pytest.approx(1, abs=0.01)
+
+
+# ---------------------------------------------------------------------------
+# Kernels — compact support evaluated on a sorted window
+# ---------------------------------------------------------------------------
+
+
+class TestKernels:
+    @pytest.mark.parametrize("kernel", ["epanechnikov", "triweight"])
+    def test_integrates_to_one(self, kernel):
+        fig = kdeplot(_data(), x="x", kernel=kernel)
+        self._figures.append(fig)
+        out = fig.render()
+        lo, hi = (
+            float(v) for v in re.search(r"x-axis \S+ (\S+) --> (\S+)", out).groups()
+        )
+        values = _series_values(out)
+        assert sum(values) * (hi - lo) / (len(values) - 1) == pytest.approx(1, abs=0.01)
+
+    @pytest.mark.parametrize("kernel", ["epanechnikov", "triweight"])
+    def test_matches_direct_sum(self, kernel):
+        import narwhals as nw
+
+        from sea_nymph.kdeplot import _COMPACT_KERNELS, _windowed_kde
+
+        values = [0.3, 1.1, 1.2, 2.9, 4.0, 4.4]
+        grid = [i * 0.25 for i in range(20)]
+        data = nw.from_native(_df({"x": values[::-1]}))
+        profile, reach = _COMPACT_KERNELS[kernel]
+        half = reach * 0.4
+        expected = [
+            sum(profile((v - g) / half) for v in values if abs(v - g) <= half)
+            / (len(values) * half)
+            for g in grid
+        ]
+        assert _windowed_kde(data, "x", grid, 0.4, kernel) == pytest.approx(expected)
+
+    def test_zero_outside_support(self):
+        fig = kdeplot(
+            _df({"x": [0.0, 10.0]}), x="x", kernel="epanechnikov", bw_adjust=0.1
+        )
+        values = _series_values(fig.render())
+        # The grid midpoint is far beyond sqrt(5) bandwidths from both points
+        assert values[len(values) // 2] == 0
+
+    def test_weights(self):
+        fig = kdeplot(
+            _df({"x": [1.0, 2.0, 3.0], "w": [1.0, 1.0, 1.0]}),
+            x="x",
+            weights="w",
+            kernel="triweight",
+        )
+        unweighted = kdeplot(_df({"x": [1.0, 2.0, 3.0]}), x="x", kernel="triweight")
+        assert _series_values(fig.render()) == pytest.approx(
+            _series_values(unweighted.render())
+        )
+
+
+# ---------------------------------------------------------------------------
+# Clip — reflection at the support bounds
+# ---------------------------------------------------------------------------
+
+
+def _skewed():
+    return _df({"x": [0.1, 0.2, 0.3, 0.5, 0.8, 1.2, 1.9, 3.0]})
+
+
+def _grid_and_values(out: str) -> tuple[float, float, list[float]]:
+    lo, hi = (float(v) for v in re.search(r"x-axis \S+ (\S+) --> (\S+)", out).groups())
+    return lo, hi, _series_values(out)
+
+
+class TestClip:
+    @pytest.mark.parametrize("kernel", ["gaussian", "epanechnikov", "triweight"])
+    def test_no_mass_below_bound(self, kernel):
+        fig = kdeplot(_skewed(), x="x", clip=(0, None), kernel=kernel)
+        self._figures.append(fig)
+        lo, hi, values = _grid_and_values(fig.render())
+        assert lo == 0
+        # Trapezoid rule over the grid: reflection keeps all mass inside
+        step = (hi - lo) / (len(values) - 1)
+        area = step * (sum(values) - (values[0] + values[-1]) / 2)
+        assert area == pytest.approx(1, abs=0.01)
+
+    def test_both_bounds(self):
+        fig = kdeplot(_data(), x="x", clip=(1, 10))
+        self._figures.append(fig)
+        out = fig.render()
+        assert 'x-axis "x" 1 --> 10' in out
+
+    def test_values_outside_ignored(self):
+        clipped = kdeplot(_df({"x": [-5.0, 1.0, 2.0, 3.0]}), x="x", clip=(0, None))
+        inside = kdeplot(_df({"x": [1.0, 2.0, 3.0]}), x="x", clip=(0, None))
+        assert clipped.render() == inside.render()
+
+    def test_reflection_matches_mirrored_data(self):
+        import narwhals as nw
+
+        from sea_nymph.kdeplot import _gaussian_kde
+
+        grid = [0.0, 0.5, 1.0, 1.5]
+        data = nw.from_native(_skewed())
+        mirrored = nw.from_native(
+            _df({"x": _skewed()["x"].to_list() + [-v for v in _skewed()["x"]]})
+        )
+        reflected = _gaussian_kde(data, "x", grid, 0.4, bounds=(0, None))
+        # Same kernel sums, normalised by the original (not doubled) count
+        expected = [2 * d for d in _gaussian_kde(mirrored, "x", grid, 0.4)]
+        assert reflected == pytest.approx(expected)
+
+
+# ---------------------------------------------------------------------------
+# Binned — pre-aggregated histograms convolved on the bin lattice
+# ---------------------------------------------------------------------------
+
+
+def _normal_bins(
+    width: float = 0.1, n: int = 2000
+) -> tuple[pl.DataFrame, pl.DataFrame]:
+    raw = [NormalDist().inv_cdf((i + 0.5) / n) for i in range(n)]
+    counts: dict[float, int] = {}
+    for v in raw:
+        center = round(v / width) * width
+        counts[center] = counts.get(center, 0) + 1
+    return _df({"x": raw}), _df(
+        {"center": list(counts), "count": list(counts.values())}
+    )
+
+
+class TestBinned:
+    @pytest.mark.parametrize("kernel", ["gaussian", "epanechnikov"])
+    def test_matches_raw_samples(self, kernel):
+        raw, bins = _normal_bins()
+        fig = kdeplot(
+            bins, x="center", weights="count", binned=True, kernel=kernel, gridsize=21
+        )
+        self._figures.append(fig)
+        expected = _series_values(
+            kdeplot(raw, x="x", kernel=kernel, gridsize=21).render()
+        )
+        assert _series_values(fig.render()) == pytest.approx(expected, abs=0.01)
+
+    def test_integrates_to_one(self):
+        _, bins = _normal_bins(width=0.5)
+        fig = kdeplot(bins, x="center", weights="count", binned=True, bw_adjust=0.2)
+        self._figures.append(fig)
+        lo, hi, values = _grid_and_values(fig.render())
+        step = (hi - lo) / (len(values) - 1)
+        assert step * sum(values) == pytest.approx(1, abs=0.01)
+
+    def test_empty_bins_may_be_omitted(self):
+        bins = _df({"center": [0.0, 1.0, 4.0], "count": [5, 3, 2]})
+        with_zeros = _df(
+            {"center": [0.0, 1.0, 2.0, 3.0, 4.0], "count": [5, 3, 0, 0, 2]}
+        )
+        fig = kdeplot(bins.lazy(), x="center", weights="count", binned=True)
+        self._figures.append(fig)
+        expected = kdeplot(with_zeros, x="center", weights="count", binned=True)
+        assert fig.render() == expected.render()
+
+    def test_hue(self):
+        bins = _df(
+            {
+                "center": [0.0, 1.0, 2.0, 0.0, 1.0, 2.0],
+                "count": [8, 2, 1, 1, 2, 8],
+                "grp": ["a", "a", "a", "b", "b", "b"],
+            }
+        )
+        fig = kdeplot(bins, x="center", weights="count", binned=True, hue="grp")
+        self._figures.append(fig)
+        a, b = (
+            [float(v) for v in line.split(", ")]
+            for line in re.findall(r"line \[([^\]]+)\]", fig.render())
+        )
+        assert a == pytest.approx(b[::-1])  # mirror images around 1
+
+    def test_needs_weights(self):
+        with pytest.raises(ValueError, match="binned=True needs weights"):
+            kdeplot(_data(), x="x", binned=True)
+
+    def test_uneven_centres(self):
+        bins = _df({"center": [0.0, 1.0, 2.5], "count": [1, 2, 3]})
+        with pytest.raises(ValueError, match="equally spaced bin centres"):
+            kdeplot(bins, x="center", weights="count", binned=True)
+
+
+# ---------------------------------------------------------------------------
+# Automatic gridsize — resolution follows the bandwidth
+# ---------------------------------------------------------------------------
+
+
+def _normal(n: int = 500, center: float = 0.0, scale: float = 1.0):
+    return [center + scale * NormalDist().inv_cdf((i + 0.5) / n) for i in range(n)]
+
+
+class TestAutoGridsize:
+    def test_wider_bandwidth_fewer_points(self):
+        data = _df({"x": _normal()})
+        sharp = _series_values(kdeplot(data, x="x", gridsize="auto").render())
+        smooth = kdeplot(data, x="x", gridsize="auto", bw_adjust=4)
+        self._figures.append(smooth)
+        assert len(_series_values(smooth.render())) < len(sharp) / 2
+
+    def test_interpolation_error_within_tolerance(self):
+        data = _df({"x": _normal()})
+        lo, hi, values = _grid_and_values(
+            kdeplot(data, x="x", gridsize="auto").render()
+        )
+        # Midpoints of the auto grid, evaluated directly on a doubled grid
+        dense = _series_values(
+            kdeplot(data, x="x", gridsize=2 * len(values) - 1).render()
+        )
+        midpoints = dense[1::2]
+        interpolated = [(a + b) / 2 for a, b in zip(values, values[1:])]
+        error = max(abs(m - i) for m, i in zip(midpoints, interpolated))
+        assert error <= 1e-3 * max(values)
+
+    def test_narrowest_hue_level_sets_resolution(self):
+        wide = _normal(200, scale=5.0)
+        narrow = _normal(200, center=2.0, scale=0.2)
+        data = _df({"x": wide + narrow, "grp": ["w"] * 200 + ["n"] * 200})
+        fig = kdeplot(data, x="x", hue="grp", gridsize="auto")
+        self._figures.append(fig)
+        only_wide = kdeplot(_df({"x": wide}), x="x", gridsize="auto")
+        points = len(_series_values(fig.render()))
+        assert points > 2 * len(_series_values(only_wide.render()))
+
+    def test_capped(self):
+        data = _df({"x": _normal(100) + [1000.0]})
+        fig = kdeplot(data, x="x", gridsize="auto", bw_method="isj")
+        assert len(_series_values(fig.render())) == 1000
+
+    def test_invalid(self):
+        with pytest.raises(ValueError, match="gridsize must be an integer or 'auto'"):
+            kdeplot(_data(), x="x", gridsize="fine")
+
+
 # ---------------------------------------------------------------------------
 # Errors
 # ---------------------------------------------------------------------------
@@ -163,6 +489,26 @@ class TestErrors:
         fig = kdeplot(_data(), y="x", gridsize=20)
         assert "xychart-beta horizontal" in fig.render()
 
+    def test_invalid_bw_method(self):
+        with pytest.raises(ValueError, match="bw_method must be one of"):
+            kdeplot(_data(), x="x", bw_method="normal")
+
+    def test_invalid_kernel(self):
+        with pytest.raises(ValueError, match="kernel must be one of"):
+            kdeplot(_data(), x="x", kernel="cosine")
+
+    def test_invalid_n_jobs(self):
+        with pytest.raises(ValueError, match="n_jobs must be a positive integer or -1"):
+            kdeplot(_data(), x="x", n_jobs=0)
+
+    def test_empty_clip(self):
+        with pytest.raises(ValueError, match="clip must have low < high"):
+            kdeplot(_data(), x="x", clip=(5, 5))
+
+    def test_isj_needs_spread(self):
+        with pytest.raises(ValueError, match="at least two distinct values"):
+            kdeplot(_df({"x": [1.0, 1.0]}), x="x", bw_method="isj")
+
     def test_gridsize_too_small(self):
         with pytest.raises(ValueError, match="gridsize must be at least 2"):
             kdeplot(_data(), x="x", gridsize=1)
@@ -1,3 +1,5 @@
+from datetime import date, datetime
+
 import pytest
 import narwhals as nw
 import polars as pl
@@ -41,6 +43,17 @@ class TestDataFrame:
         out = fig.render()
         assert "line [4, 6, 6]" in out
 
+    def test_multiple_estimators(self):
+        fig = lineplot(
+            self._data(),
+            x="x",
+            y="y",
+            estimator={"mean": nw.col("y").mean(), "max": nw.col("y").max()},
+        )
+        self._figures.append(fig)
+        out = fig.render()
+        assert out.index("line [2, 3, 3]") < out.index("line [3, 4, 5]")
+
     def test_color(self):
         fig = lineplot(self._data(), x="x", y="y", color="#ff0000")
         self._figures.append(fig)
@@ -87,6 +100,20 @@ class TestHue:
         out = fig.render()
         assert out.index("line [30") < out.index("line [10")
 
+    def test_first_seen_order_lazy(self):
+        data = _df(
+            {
+                "category": ["Y", "X", "Y", "X"],
+                "value": [10.0, 20.0, 30.0, 40.0],
+                "group": ["b", "b", "a", "a"],
+            }
+        )
+        fig = lineplot(data.lazy(), x="category", y="value", hue="group")
+        self._figures.append(fig)
+        out = fig.render()
+        assert "[Y, X]" in out
+        assert out.index("line [10, 20]") < out.index("line [30, 40]")
+
     def test_palette_list(self):
         fig = lineplot(
             self._data(),
@@ -114,6 +141,315 @@ class TestHue:
         assert "#bbbbbb" in out
 
 
+# ---------------------------------------------------------------------------
+# Fill — reindex numeric x onto an evenly spaced grid
+# ---------------------------------------------------------------------------
+
+
+class TestFill:
+    def _data(self):
+        # x=2 was dropped
+        return _df({"x": [0.0, 1.0, 3.0, 4.0], "y": [0.0, 2.0, 6.0, 8.0]})
+
+    def test_interpolate(self):
+        fig = lineplot(self._data(), x="x", y="y", fill="interpolate")
+        self._figures.append(fig)
+        out = fig.render()
+        assert "x-axis 0 --> 4" in out
+        assert "line [0, 2, 4, 6, 8]" in out
+
+    def test_zero(self):
+        fig = lineplot(self._data(), x="x", y="y", fill="zero")
+        self._figures.append(fig)
+        assert "line [0, 2, 0, 6, 8]" in fig.render()
+
+    def test_explicit_step(self):
+        fig = lineplot(self._data(), x="x", y="y", fill="interpolate", step=0.5)
+        self._figures.append(fig)
+        assert "line [0, 1, 2, 3, 4, 5, 6, 7, 8]" in fig.render()
+
+    def test_interpolate_per_hue(self):
+        df = _df(
+            {
+                "x": [0.0, 1.0, 3.0, 0.0, 2.0, 3.0],
+                "y": [0.0, 1.0, 3.0, 5.0, 5.0, 8.0],
+                "g": ["a", "a", "a", "b", "b", "b"],
+            }
+        )
+        fig = lineplot(df, x="x", y="y", hue="g", fill="interpolate")
+        self._figures.append(fig)
+        out = fig.render()
+        assert "line [0, 1, 2, 3]" in out
+        assert "line [5, 5, 5, 8]" in out
+
+    @pytest.mark.parametrize("resample", [None, "1h"], ids=["step", "resample"])
+    def test_interpolate_per_hue_pyarrow(self, resample):
+        pytest.importorskip("pyarrow")
+        if resample:
+            t = [datetime(2024, 1, 1, h) for h in (0, 3, 1, 2)]
+            df = _df({"t": t, "y": [1.0, 4.0, 10.0, 20.0], "g": list("aabb")})
+            kwargs = {"resample": resample}
+        else:
+            t = [0.0, 1.0, 3.0, 0.5, 2.0, 3.0]
+            df = _df({"t": t, "y": [1.0, 2.0, 4.0, 5.0, 7.0, 8.0], "g": list("aaabbb")})
+            kwargs = {"step": 0.5}
+        kwargs.update(x="t", y="y", hue="g", fill="interpolate")
+        fig = lineplot(df.to_arrow(), **kwargs)
+        self._figures.append(fig)
+        assert fig.render() == lineplot(df, **kwargs).render()
+
+    def test_interpolate_holds_edges(self):
+        df = _df(
+            {
+                "x": [0.0, 1.0, 2.0, 1.0],
+                "y": [1.0, 2.0, 3.0, 7.0],
+                "g": ["a", "a", "a", "b"],
+            }
+        )
+        fig = lineplot(df, x="x", y="y", hue="g", fill="interpolate")
+        self._figures.append(fig)
+        assert "line [7, 7, 7]" in fig.render()
+
+    def test_nan_drop_trims_edges(self):
+        df = _df(
+            {
+                "x": [0.0, 1.0, 2.0, 1.0, 2.0],
+                "y": [1.0, 2.0, 3.0, 7.0, 8.0],
+                "g": ["a", "a", "a", "b", "b"],
+            }
+        )
+        fig = lineplot(df, x="x", y="y", hue="g", fill="nan-drop")
+        self._figures.append(fig)
+        out = fig.render()
+        assert "x-axis 1 --> 2" in out
+        assert "line [2, 3]" in out
+        assert "line [7, 8]" in out
+
+    def test_nan_drop_pandas(self):
+        pd = pytest.importorskip("pandas")
+        df = pd.DataFrame(
+            {"x": [0.0, 1.0, 2.0, 1.0, 2.0], "y": [1.0, 2.0, 3.0, 7.0, 8.0]}
+        )
+        df["g"] = ["a", "a", "a", "b", "b"]
+        fig = lineplot(df, x="x", y="y", hue="g", fill="nan-drop")
+        self._figures.append(fig)
+        out = fig.render()
+        assert "x-axis 1 --> 2" in out
+        assert "line [2, 3]" in out
+        assert "line [7, 8]" in out
+
+    def test_nan_drop_pandas_interior_gap_raises(self):
+        pd = pytest.importorskip("pandas")
+        df = pd.DataFrame({"x": [0.0, 1.0, 3.0], "y": [1.0, 2.0, 4.0]})
+        with pytest.raises(ValueError, match="not evenly spaced"):
+            lineplot(df, x="x", y="y", fill="nan-drop")
+
+    def test_near_duplicate_x_exceeds_grid_cap(self):
+        df = _df({"x": [0.0, 0.001, 1000.0], "y": [1.0, 2.0, 3.0]})
+        with pytest.raises(ValueError, match="more than 10,000"):
+            lineplot(df, x="x", y="y", fill="zero")
+
+    def test_resample_exceeds_grid_cap(self):
+        df = _df({"t": [datetime(2024, 1, 1), datetime(2024, 1, 2)], "y": [1.0, 2.0]})
+        with pytest.raises(ValueError, match="longer resample interval"):
+            lineplot(df, x="t", y="y", resample="1s")
+
+    @pytest.mark.parametrize("step", [0, -1.0])
+    def test_non_positive_step_raises(self, step):
+        with pytest.raises(ValueError, match="step must be positive"):
+            lineplot(self._data(), x="x", y="y", fill="zero", step=step)
+
+    def test_nan_drop_interior_gap_raises(self):
+        with pytest.raises(ValueError, match="not evenly spaced"):
+            lineplot(self._data(), x="x", y="y", fill="nan-drop")
+
+    def test_resample_interpolate(self):
+        df = _df(
+            {"t": [datetime(2024, 1, 1, 0), datetime(2024, 1, 1, 3)], "y": [1.0, 4.0]}
+        )
+        fig = lineplot(df, x="t", y="y", resample="1h", fill="interpolate")
+        self._figures.append(fig)
+        assert "line [1, 2, 3, 4]" in fig.render()
+
+    def test_invalid_fill(self):
+        with pytest.raises(ValueError, match="fill must be one of"):
+            lineplot(self._data(), x="x", y="y", fill="ffill")
+
+    def test_categorical_x_raises(self):
+        with pytest.raises(ValueError, match="fill requires a numeric x"):
+            lineplot(_df({"x": ["a"], "y": [1.0]}), x="x", y="y", fill="zero")
+
+
+# ---------------------------------------------------------------------------
+# Resample — datetime x bucketed in the engine
+# ---------------------------------------------------------------------------
+
+
+class TestResample:
+    def _data(self):
+        return _df(
+            {
+                "t": [
+                    datetime(2024, 1, 1, 0, 10),
+                    datetime(2024, 1, 1, 0, 50),
+                    datetime(2024, 1, 1, 1, 30),
+                    datetime(2024, 1, 1, 3, 5),
+                ],
+                "y": [1.0, 3.0, 5.0, 7.0],
+            }
+        )
+
+    def test_hourly_buckets(self):
+        fig = lineplot(self._data(), x="t", y="y", resample="1h")
+        self._figures.append(fig)
+        out = fig.render()
+        assert out.count("2024-01-01") == 4  # 00:00, 01:00, 02:00, 03:00
+        assert "line [2, 5, 0, 7]" in out  # empty 02:00 bucket filled
+
+    def test_estimator_applies_per_bucket(self):
+        fig = lineplot(
+            self._data(), x="t", y="y", resample="2h", estimator=nw.col("y").sum()
+        )
+        self._figures.append(fig)
+        assert "line [9, 7]" in fig.render()
+
+    def test_monthly_buckets(self):
+        df = _df(
+            {
+                "d": [date(2023, 11, 5), date(2024, 2, 1), date(2024, 2, 20)],
+                "y": [1.0, 2.0, 4.0],
+            }
+        )
+        fig = lineplot(df, x="d", y="y", resample="1mo")
+        self._figures.append(fig)
+        out = fig.render()
+        assert "x-axis [2023-11-01, 2023-12-01, 2024-01-01, 2024-02-01]" in out
+        assert "line [1, 0, 0, 3]" in out
+
+    def test_hue(self):
+        df = self._data().with_columns(pl.Series("g", ["a", "b", "a", "b"]))
+        fig = lineplot(df, x="t", y="y", hue="g", resample="1h")
+        self._figures.append(fig)
+        out = fig.render()
+        assert "line [1, 5, 0, 0]" in out
+        assert "line [3, 0, 0, 7]" in out
+
+    def test_dst_spring_forward(self):
+        # Seven hours of data; 02:00 does not exist in Berlin on 2024-03-31
+        t = pl.datetime_range(
+            datetime(2024, 3, 30, 22),
+            datetime(2024, 3, 31, 5),
+            "1h",
+            time_zone="Europe/Berlin",
+            eager=True,
+        )
+        df = pl.DataFrame({"t": t, "y": [float(i) for i in range(len(t))]})
+        fig = lineplot(df, x="t", y="y", resample="1h")
+        self._figures.append(fig)
+        out = fig.render()
+        assert "02:00:00" not in out
+        assert "2024-03-31 05:00:00+02:00" in out
+        assert "line [0, 1, 2, 3, 4, 5, 6]" in out
+
+    def test_daily_buckets_on_dst_day(self):
+        t = [datetime(2024, 3, 30, 12), datetime(2024, 3, 31, 12), datetime(2024, 4, 1)]
+        df = pl.DataFrame({"t": t, "y": [1.0, 2.0, 3.0]}).with_columns(
+            pl.col("t").dt.replace_time_zone("Europe/Berlin")
+        )
+        fig = lineplot(df, x="t", y="y", resample="1d")
+        self._figures.append(fig)
+        assert "line [1, 2, 3]" in fig.render()
+
+    def test_date_daily_buckets(self):
+        df = _df({"d": [date(2024, 1, 1), date(2024, 1, 3)], "y": [1.0, 2.0]})
+        fig = lineplot(df, x="d", y="y", resample="1d")
+        self._figures.append(fig)
+        assert "x-axis [2024-01-01, 2024-01-02, 2024-01-03]" in fig.render()
+
+    def test_subday_on_date_raises(self):
+        df = _df({"d": [date(2024, 1, 1), date(2024, 1, 3)], "y": [1.0, 2.0]})
+        with pytest.raises(ValueError, match="shorter than a day, but 'd' is a Date"):
+            lineplot(df, x="d", y="y", resample="1h")
+
+    def test_non_temporal_raises(self):
+        with pytest.raises(ValueError, match="resample requires a date/datetime"):
+            lineplot(_df({"x": [1.0], "y": [1.0]}), x="x", y="y", resample="1h")
+
+    def test_invalid_every_raises(self):
+        with pytest.raises(ValueError, match="resample must look like"):
+            lineplot(self._data(), x="t", y="y", resample="hourly")
+
+
+# ---------------------------------------------------------------------------
+# Error bands — variance and count aggregated with the estimate
+# ---------------------------------------------------------------------------
+
+
+class TestErrorbar:
+    def _data(self):
+        # Per x: [0, 4] has mean 2 and sd ~2.83; [1, 3, 5] has mean 3 and sd 2
+        return _df({"x": [1, 1, 2, 2, 2], "y": [0.0, 4.0, 1.0, 3.0, 5.0]})
+
+    def test_sd(self):
+        fig = lineplot(self._data(), x="x", y="y", errorbar="sd")
+        self._figures.append(fig)
+        out = fig.render(precision=4)
+        assert "line [2, 3]\n    line [-0.8284, 1]\n    line [4.8284, 5]" in out
+
+    def test_sd_multiple(self):
+        fig = lineplot(self._data(), x="x", y="y", errorbar=("sd", 2))
+        self._figures.append(fig)
+        assert "line [-3.6569, -1]" in fig.render(precision=4)
+
+    def test_se(self):
+        fig = lineplot(self._data(), x="x", y="y", errorbar="se")
+        self._figures.append(fig)
+        assert "line [4, 4.1547]" in fig.render(precision=4)  # sd / sqrt(n)
+
+    def test_ci(self):
+        fig = lineplot(self._data().lazy(), x="x", y="y", errorbar=("ci", 95))
+        self._figures.append(fig)
+        assert "line [5.9199, 5.2632]" in fig.render(precision=4)  # 1.96 * se
+
+    def test_single_row_collapses(self):
+        fig = lineplot(_df({"x": [1, 2], "y": [1.0, 2.0]}), x="x", y="y", errorbar="sd")
+        self._figures.append(fig)
+        assert fig.render().count("line [1, 2]") == 3
+
+    def test_hue_shares_colour(self):
+        data = self._data().with_columns(pl.Series("h", ["a", "b", "a", "b", "a"]))
+        fig = lineplot(
+            data, x="x", y="y", hue="h", errorbar="sd", palette=["#f00", "#00f"]
+        )
+        self._figures.append(fig)
+        assert "'#f00,#f00,#f00,#00f,#00f,#00f'" in fig.render()
+
+    def test_with_fill(self):
+        data = _df({"x": [1, 1, 3, 3], "y": [1.0, 3.0, 5.0, 9.0]})
+        fig = lineplot(data, x="x", y="y", errorbar="se", fill="interpolate", step=1)
+        self._figures.append(fig)
+        out = fig.render()
+        assert "line [2, 4.5, 7]\n    line [1, 3, 5]\n    line [3, 6, 9]" in out
+
+    def test_invalid(self):
+        with pytest.raises(ValueError, match="errorbar must be one of"):
+            lineplot(self._data(), x="x", y="y", errorbar="pi")
+
+    def test_invalid_ci_level(self):
+        with pytest.raises(ValueError, match="ci level must be between 0 and 100"):
+            lineplot(self._data(), x="x", y="y", errorbar=("ci", 190))
+
+    def test_multiple_estimators_raise(self):
+        with pytest.raises(ValueError, match="errorbar requires a single estimator"):
+            lineplot(
+                self._data(),
+                x="x",
+                y="y",
+                estimator=[nw.col("y").min(), nw.col("y").max()],
+                errorbar="sd",
+            )
+
+
 # ---------------------------------------------------------------------------
 # Errors
 # ---------------------------------------------------------------------------
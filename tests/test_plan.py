@@ -0,0 +1,118 @@
+import narwhals as nw
+import polars as pl
+import pytest
+
+import sea_nymph
+from sea_nymph import barplot, countplot, histplot, kdeplot, plan
+
+
+def _df(data: dict):
+    return pl.DataFrame(data)
+
+
+def _data():
+    return _df(
+        {
+            "region": ["N", "S", "N", "E", "S", "E"],
+            "tier": ["a", "b", "b", "a", "a", "b"],
+            "latency": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+        }
+    )
+
+
+# ---------------------------------------------------------------------------
+# Matches the plot functions
+# ---------------------------------------------------------------------------
+
+
+class TestMatchesDirectCalls:
+    @pytest.mark.parametrize("lazy", [False, True])
+    def test_dashboard(self, lazy):
+        data = _data()
+        figs = (
+            plan(data.lazy() if lazy else data)
+            .countplot(x="region")
+            .histplot(x="latency", bins=3)
+            .barplot(x="region", y="latency")
+            .kdeplot(x="latency")
+            .execute()
+        )
+        self._figures.extend(figs)
+        expected = [
+            countplot(data, x="region"),
+            histplot(data, x="latency", bins=3),
+            barplot(data, x="region", y="latency"),
+            kdeplot(data, x="latency"),
+        ]
+        assert [f.render() for f in figs] == [e.render() for e in expected]
+
+    def test_shared_group_with_hue(self):
+        data = _data()
+        peak = nw.col("latency").max()
+        figs = (
+            plan(data)
+            .countplot(y="region", hue="tier", stat="percent")
+            .barplot(x="latency", y="region", hue="tier", estimator=peak)
+            .execute()
+        )
+        self._figures.extend(figs)
+        assert figs[0].render() == (
+            countplot(data, y="region", hue="tier", stat="percent").render()
+        )
+        assert figs[1].render() == (
+            barplot(data, x="latency", y="region", hue="tier", estimator=peak).render()
+        )
+
+    def test_explicit_order_kept(self):
+        data = _data()
+        (fig,) = plan(data).countplot(x="region", order=["E", "N", "S"]).execute()
+        self._figures.append(fig)
+        assert "bar [2, 2, 2]" in fig.render()
+        assert "[E, N, S]" in fig.render()
+
+    def test_estimator_list_not_shared(self):
+        data = _data()
+        estimator = [nw.col("latency").min(), nw.col("latency").max()]
+        (fig,) = (
+            plan(data).barplot(x="region", y="latency", estimator=estimator).execute()
+        )
+        self._figures.append(fig)
+        assert fig.render() == (
+            barplot(data, x="region", y="latency", estimator=estimator).render()
+        )
+
+    @pytest.mark.parametrize("shared", [True, False], ids=["shared", "single"])
+    def test_estimator_columns_not_passed_to_plot(self, shared):
+        data = _data().with_columns(pl.col("latency").alias("peak"))
+        peak = nw.col("peak").max()
+        # A list of estimators is not shareable, so it runs on its own
+        estimator = peak if shared else [peak, nw.col("peak").min()]
+        (fig,) = (
+            plan(data)
+            .barplot(x="region", y="latency", estimator=estimator, columns=["peak"])
+            .execute()
+        )
+        self._figures.append(fig)
+        assert fig.render() == (
+            barplot(data, x="region", y="latency", estimator=estimator).render()
+        )
+
+    def test_sampled_request_not_shared(self):
+        data = _data()
+        (fig,) = plan(data).countplot(x="region", sample=3, seed=0).execute()
+        self._figures.append(fig)
+        expected = countplot(data, x="region", sample=3, seed=0)
+        assert fig.render() == expected.render()
+
+
+# ---------------------------------------------------------------------------
+# Builder
+# ---------------------------------------------------------------------------
+
+
+class TestBuilder:
+    def test_exported(self):
+        assert isinstance(plan(_data()), sea_nymph.Plan)
+
+    def test_empty(self):
+        assert plan(_data()).execute() == []
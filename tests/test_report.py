@@ -0,0 +1,96 @@
+import pytest
+
+from sea_nymph import Report
+from sea_nymph.mermaidplotlib import XYChart
+
+
+def _chart(values):
+    return XYChart().bar(["A", "B"], values)
+
+
+# ---------------------------------------------------------------------------
+# Streaming output
+# ---------------------------------------------------------------------------
+
+
+class TestStreaming:
+    def test_blocks_in_order(self, tmp_path):
+        path = tmp_path / "report.md"
+        with Report(path) as report:
+            report.heading("Sales")
+            report.text("Quarterly numbers.")
+            report.chart(_chart([1.0, 2.0]))
+        assert path.read_text(encoding="utf-8") == (
+            "# Sales\n\nQuarterly numbers.\n\n" + str(_chart([1.0, 2.0])) + "\n"
+        )
+
+    def test_matches_joined_charts(self, tmp_path):
+        charts = [_chart([float(i), float(i + 1)]) for i in range(50)]
+        path = tmp_path / "report.md"
+        with Report(path) as report:
+            for chart in charts:
+                report.chart(chart)
+        expected = "\n\n".join(str(c) for c in charts) + "\n"
+        assert path.read_text(encoding="utf-8") == expected
+
+    def test_streams_before_close(self, tmp_path):
+        path = tmp_path / "report.md"
+        with Report(path, buffer_size=1) as report:  # line-buffered
+            report.chart(_chart([1.0, 2.0]))
+            assert "bar [1, 2]" in path.read_text(encoding="utf-8")
+
+    def test_heading_level(self, tmp_path):
+        path = tmp_path / "report.md"
+        with Report(path) as report:
+            report.heading("Detail", level=3)
+        assert path.read_text(encoding="utf-8") == "### Detail\n"
+
+
+# ---------------------------------------------------------------------------
+# Table of contents
+# ---------------------------------------------------------------------------
+
+
+class TestTableOfContents:
+    def test_toc_prepended(self, tmp_path):
+        path = tmp_path / "report.md"
+        with Report(path, toc=True) as report:
+            report.heading("Latency Overview", level=2)
+            report.chart(_chart([1.0, 2.0]))
+            report.heading("By region", level=3)
+        out = path.read_text(encoding="utf-8")
+        assert out.startswith(
+            "- [Latency Overview](#latency-overview)\n"
+            "  - [By region](#by-region)\n\n"
+            "## Latency Overview\n\n```mermaid"
+        )
+
+    def test_duplicate_anchors(self, tmp_path):
+        path = tmp_path / "report.md"
+        with Report(path, toc=True) as report:
+            report.heading("Results")
+            report.heading("Results")
+        out = path.read_text(encoding="utf-8")
+        assert "- [Results](#results)\n- [Results](#results-1)\n" in out
+
+    def test_part_file_removed(self, tmp_path):
+        path = tmp_path / "report.md"
+        with Report(path, toc=True) as report:
+            report.heading("Only")
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["report.md"]
+
+
+# ---------------------------------------------------------------------------
+# Errors
+# ---------------------------------------------------------------------------
+
+
+class TestErrors:
+    def test_not_open(self, tmp_path):
+        with pytest.raises(ValueError, match="not open"):
+            Report(tmp_path / "report.md").text("hello")
+
+    def test_bad_heading_level(self, tmp_path):
+        with Report(tmp_path / "report.md") as report:
+            with pytest.raises(ValueError, match="level must be between 1 and 6"):
+                report.heading("Too deep", level=7)
@@ -0,0 +1,105 @@
+import random
+
+import pytest
+import polars as pl
+
+from sea_nymph import QuantileSketch
+
+
+def _values(n: int = 20_000, seed: int = 0) -> list[float]:
+    rng = random.Random(seed)
+    return [rng.gauss(0, 1) for _ in range(n)]
+
+
+def _rank(values: list[float], v: float) -> float:
+    return sum(x <= v for x in values) / len(values)
+
+
+# ---------------------------------------------------------------------------
+# Summary statistics
+# ---------------------------------------------------------------------------
+
+
+class TestSummary:
+    def test_exact_moments(self):
+        values = [3.0, 1.0, 4.0, 1.0, 5.0]
+        sketch = QuantileSketch().update(values)
+        assert sketch.n == 5
+        assert (sketch.min, sketch.max) == (1.0, 5.0)
+        assert sketch.std == pytest.approx(1.7888544)
+
+    def test_skips_nulls_and_nan(self):
+        sketch = QuantileSketch().update(pl.Series([1.0, None, float("nan"), 2.0]))
+        assert sketch.n == 2
+
+    def test_quantile_ends_are_exact(self):
+        values = _values()
+        sketch = QuantileSketch(k=32).update(values)
+        assert sketch.quantile(0) == min(values)
+        assert sketch.quantile(1) == max(values)
+
+
+# ---------------------------------------------------------------------------
+# Accuracy and bounded memory
+# ---------------------------------------------------------------------------
+
+
+class TestAccuracy:
+    @pytest.mark.parametrize("q", [0.05, 0.25, 0.5, 0.75, 0.95])
+    def test_rank_error(self, q):
+        values = _values()
+        sketch = QuantileSketch(seed=1)
+        for i in range(0, len(values), 500):
+            sketch.update(values[i : i + 500])
+        assert _rank(values, sketch.quantile(q)) == pytest.approx(q, abs=0.02)
+
+    def test_memory_bounded(self):
+        sketch = QuantileSketch(k=64, seed=0).update(_values(50_000))
+        assert sum(len(items) for items in sketch._compactors) <= 3 * 64
+
+    def test_histogram_total(self):
+        values = _values()
+        counts = QuantileSketch(seed=0).update(values).histogram([-10.0, 0.0, 10.0])
+        assert sum(counts) == len(values)
+        assert counts[0] == pytest.approx(_rank(values, 0.0) * len(values), rel=0.05)
+
+
+# ---------------------------------------------------------------------------
+# Merging partitions
+# ---------------------------------------------------------------------------
+
+
+class TestMerge:
+    def test_matches_single_pass(self):
+        values = _values()
+        parts = [QuantileSketch(seed=i).update(values[i::4]) for i in range(4)]
+        merged = parts[0]
+        for part in parts[1:]:
+            merged.merge(part)
+        assert merged.n == len(values)
+        assert (merged.min, merged.max) == (min(values), max(values))
+        assert merged.std == pytest.approx(QuantileSketch().update(values).std)
+        assert _rank(values, merged.quantile(0.5)) == pytest.approx(0.5, abs=0.02)
+
+    def test_merge_empty(self):
+        sketch = QuantileSketch().update([1.0, 2.0])
+        assert sketch.merge(QuantileSketch()).n == 2
+
+
+# ---------------------------------------------------------------------------
+# Errors
+# ---------------------------------------------------------------------------
+
+
+class TestErrors:
+    def test_small_k(self):
+        with pytest.raises(ValueError, match="k must be at least 8"):
+            QuantileSketch(k=4)
+
+    def test_quantile_out_of_range(self):
+        with pytest.raises(ValueError, match="q must be between 0 and 1"):
+            QuantileSketch().update([1.0]).quantile(1.5)
+
+    def test_empty_quantile(self):
+        with pytest.raises(ValueError, match="empty sketch"):
+            QuantileSketch().quantile(0.5)